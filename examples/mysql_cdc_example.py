@@ -124,7 +124,6 @@ def main():
     result = create_mysql_cdc_source_connection(
         rw_client=client,
         mysql_config=secure_mysql_config,
-        include_all_tables=True,
         exclude_tables=["temp_*", "backup_*"],
         column_configs=column_configs,
         include_timestamp=True,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
 from ..client import RisingWaveClient
 from ..discovery.base import TableSelector, TableInfo, TableColumnConfig
@@ -14,8 +15,31 @@ logger = logging.getLogger(__name__)
 class BaseSourceBuilder(ABC):
     """Base class for source builders."""
 
+    # Seconds that discovery results are reused for the same source
+    discovery_cache_ttl: float = 60.0
+
     def __init__(self, rw_client: RisingWaveClient):
         self.rw_client = rw_client
+        self._discovery_cache: Dict[tuple, Tuple[float, Any]] = {}
+
+    def clear_discovery_cache(self) -> None:
+        """Drop cached discovery results so the next call queries the source."""
+        self._discovery_cache.clear()
+
+    def _cached(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Return fetch() cached under key for discovery_cache_ttl seconds.
+
+        The same object is handed to every caller, so fetch() must return an
+        immutable value, such as a tuple of frozen TableInfo. Exceptions are
+        not cached, so a failed lookup is retried next time.
+        """
+        now = time.monotonic()
+        entry = self._discovery_cache.get(key)
+        if entry is not None and now - entry[0] < self.discovery_cache_ttl:
+            return entry[1]
+        value = fetch()
+        self._discovery_cache[key] = (now, value)
+        return value
 
     @abstractmethod
     def create_connection(self, config: Any, **kwargs) -> Dict[str, Any]:
@@ -42,6 +66,16 @@ class BaseSourceBuilder(ABC):
             return TableSelector(specific_tables=table_selector)
         return table_selector
 
+    @staticmethod
+    def _preselected_tables(
+        table_selector: Optional[Union[TableSelector, List[str], List[TableInfo]]]
+    ) -> Optional[List[TableInfo]]:
+        """Return the tables if table_selector is a list of TableInfo, else None."""
+        if (isinstance(table_selector, list) and table_selector
+                and all(isinstance(table, TableInfo) for table in table_selector)):
+            return list(table_selector)
+        return None
+
     def _create_placeholder_tables(
         self,
         table_names: List[str],
@@ -71,9 +71,8 @@ class KafkaBuilder(BaseSourceBuilder):
                 sql_statements.append(table_sql)
 
             if not dry_run:
-                # Execute SQL statements
-                for sql in sql_statements:
-                    self.rw_client.execute_sql(sql)
+                # Execute SQL statements in order over one connection
+                self.rw_client.execute_many(sql_statements)
 
             # Return success result
             return {
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import logging
+from itertools import chain
 from typing import Dict, List, Optional, Any, Union
 
 from .base import BaseSourceBuilder
@@ -35,44 +36,27 @@ class MongoDBBuilder(BaseSourceBuilder):
                 raise ConnectionError(
                     f"Cannot connect to MongoDB at {config.mongodb_url}")
 
-        # For MongoDB, we need to discover collections based on the patterns in config
-        available_tables = []
-
-        # Parse collection patterns from config
-        patterns = config.get_collection_patterns()
-
-        for pattern in patterns:
-            if '.' in pattern:
-                db_part, collection_part = pattern.split('.', 1)
+        # Convert list of collection names to TableSelector
+        if isinstance(table_selector, list):
+            table_selector = TableSelector(specific_tables=table_selector)
 
-                # If it's a wildcard pattern like 'db.*', discover all collections in that database
-                if collection_part == '*':
-                    collections = discovery.list_tables(db_part)
-                    available_tables.extend(collections)
-                else:
-                    # Specific collection - check if it exists
-                    specific_tables = discovery.check_specific_tables([
-                                                                      pattern])
-                    available_tables.extend(specific_tables)
-            else:
-                # Pattern without database - use default database or error
-                if config.database_name:
-                    full_pattern = f"{config.database_name}.{pattern}"
-                    specific_tables = discovery.check_specific_tables(
-                        [full_pattern])
-                    available_tables.extend(specific_tables)
-                else:
-                    logger.warning(
-                        f"Collection pattern '{pattern}' lacks database name and no default database specified")
+        specific = table_selector.specific_tables if table_selector is not None else []
+        default_database = self._default_database(config)
+        if dry_run and specific and (
+                default_database or all('.' in name for name in specific)):
+            # Explicit collection names need no round-trip to MongoDB in dry
+            # run mode; the selector only has to resolve the names
+            available_tables = self._create_placeholder_tables(
+                specific, default_database)
+        else:
+            # For MongoDB, we need to discover collections based on the patterns in config
+            available_tables = self._discover_collections(discovery, config)
 
         logger.info(f"Found {len(available_tables)} collections")
 
         # Select collections: if table_selector is not specified, use all discovered collections
         if table_selector is None:
             table_selector = TableSelector(include_all=True)
-        elif isinstance(table_selector, list):
-            # Convert list of collection names to TableSelector
-            table_selector = TableSelector(specific_tables=table_selector)
 
         selected_tables = table_selector.select_tables(available_tables)
         logger.info(f"Selected {len(selected_tables)} collections for CDC")
@@ -98,21 +82,21 @@ class MongoDBBuilder(BaseSourceBuilder):
         if not dry_run and sql_statements:
             try:
                 # Execute source creation
-                source_result = self.rw_client.execute_sql(sql_statements[0])
+                self.rw_client.execute(sql_statements[0])
                 execution_results.append({
                     "sql": sql_statements[0],
-                    "success": source_result.get("success", True),
-                    "message": source_result.get("message", "Source created")
+                    "success": True,
+                    "message": "Source created"
                 })
 
                 # Execute table creations
                 for i, table_sql in enumerate(sql_statements[1:], 1):
                     try:
-                        table_result = self.rw_client.execute_sql(table_sql)
+                        self.rw_client.execute(table_sql)
                         execution_results.append({
                             "sql": table_sql,
-                            "success": table_result.get("success", True),
-                            "message": table_result.get("message", f"Table {i} created")
+                            "success": True,
+                            "message": f"Table {i} created"
                         })
                     except Exception as e:
                         execution_results.append({
@@ -143,6 +127,49 @@ class MongoDBBuilder(BaseSourceBuilder):
             "executed": not dry_run
         }
 
+    @staticmethod
+    def _default_database(config: MongoDBConfig) -> Optional[str]:
+        """Database for unqualified collection names, if the config names exactly one."""
+        if config.database_name:
+            return config.database_name
+        database_names = config.get_database_names()
+        return database_names[0] if len(database_names) == 1 else None
+
+    def _discover_collections(
+        self,
+        discovery: MongoDBDiscovery,
+        config: MongoDBConfig
+    ) -> List[TableInfo]:
+        """Discover collections matching the collection patterns in config."""
+        # Collections found per pattern, flattened once at the end
+        per_pattern: List[List[TableInfo]] = []
+
+        # Parse collection patterns from config
+        patterns = config.get_collection_patterns()
+
+        for pattern in patterns:
+            if '.' in pattern:
+                db_part, collection_part = pattern.split('.', 1)
+
+                # If it's a wildcard pattern like 'db.*', discover all collections in that database
+                if collection_part == '*':
+                    per_pattern.append(discovery.list_tables(db_part))
+                else:
+                    # Specific collection - check if it exists
+                    per_pattern.append(
+                        discovery.check_specific_tables([pattern]))
+            else:
+                # Pattern without database - use default database or error
+                if config.database_name:
+                    full_pattern = f"{config.database_name}.{pattern}"
+                    per_pattern.append(
+                        discovery.check_specific_tables([full_pattern]))
+                else:
+                    logger.warning(
+                        f"Collection pattern '{pattern}' lacks database name and no default database specified")
+
+        return list(chain.from_iterable(per_pattern))
+
     def discover_tables(
         self,
         config: MongoDBConfig,
@@ -93,9 +93,8 @@ class MySQLBuilder(BaseSourceBuilder):
                 created_tables.append(table_info.table_name)
 
             if not dry_run:
-                # Execute SQL statements
-                for sql in sql_statements:
-                    self.rw_client.execute_sql(sql)
+                # Execute SQL statements in order over one connection
+                self.rw_client.execute_many(sql_statements)
 
             # Return success result
             return {
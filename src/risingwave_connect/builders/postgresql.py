@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 import logging
-from typing import Dict, List, Optional, Any, Union
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+import psycopg
 
 from .base import BaseSourceBuilder
 from ..discovery.base import TableSelector, TableInfo, TableColumnConfig
@@ -17,42 +20,50 @@ class PostgreSQLBuilder(BaseSourceBuilder):
     def create_connection(
         self,
         config: PostgreSQLConfig,
-        table_selector: Optional[Union[TableSelector, List[str]]] = None,
+        table_selector: Optional[Union[TableSelector, List[str], List[TableInfo]]] = None,
         column_configs: Optional[Dict[str, TableColumnConfig]] = None,
         dry_run: bool = False
     ) -> Dict[str, Any]:
-        """Create a complete PostgreSQL CDC connection with table discovery."""
+        """Create a complete PostgreSQL CDC connection with table discovery.
+
+        table_selector may also be a list of TableInfo (e.g. from
+        discover_tables), which is used as the selection directly.
+        """
         # Initialize discovery and connection
-        discovery = PostgreSQLDiscovery(config)
-        pg_source = PostgreSQLSourceConnection(self.rw_client, config)
+        with PostgreSQLDiscovery(config) as discovery:
+            return self._create_connection(
+                discovery, config, table_selector, column_configs, dry_run)
+
+    def _create_connection(
+        self,
+        discovery: PostgreSQLDiscovery,
+        config: PostgreSQLConfig,
+        table_selector: Optional[Union[TableSelector, List[str], List[TableInfo]]],
+        column_configs: Optional[Dict[str, TableColumnConfig]],
+        dry_run: bool
+    ) -> Dict[str, Any]:
+        """Build and run the CDC SQL using an open discovery session."""
+        # Share the discovery session so column validation reuses its connection
+        pg_source = PostgreSQLSourceConnection(
+            self.rw_client, config, discovery=discovery)
 
         # Set dry_run mode on pipeline for column validation
         pg_source._dry_run_mode = dry_run
 
-        # Test connection (skip in dry run mode)
-        if not dry_run:
-            connection_test = discovery.test_connection()
-            if not connection_test.get("success"):
-                raise ConnectionError(
-                    f"Cannot connect to PostgreSQL at {config.hostname}:{config.port}. "
-                    f"Error: {connection_test.get('message', 'Unknown error')}"
-                )
-
-        # Validate and convert table_selector
-        table_selector = self._validate_table_selector(table_selector, dry_run)
-
-        # Get available tables
-        available_tables = self._get_available_tables(
-            discovery, config, table_selector, dry_run)
-
-        logger.info(f"Found {len(available_tables)} tables")
-
-        # Select tables: if table_selector is not specified, include all source tables
-        if table_selector is None:
-            table_selector = TableSelector(include_all=True)
-
-        selected_tables = table_selector.select_tables(available_tables)
-        logger.info(f"Selected {len(selected_tables)} tables for CDC")
+        preselected = self._preselected_tables(table_selector)
+        if preselected is not None:
+            # Tables already resolved by the caller (e.g. from discover_tables)
+            # need no existence check or pattern selection
+            selected_tables = preselected
+        else:
+            # Validate and convert table_selector
+            table_selector = self._validate_table_selector(
+                table_selector, dry_run)
+            # The first discovery query doubles as the connection check
+            with self._connection_errors(config):
+                selected_tables = self._select_tables(
+                    discovery, config, table_selector, dry_run)
+        logger.info("Selected %d tables for CDC", len(selected_tables))
 
         # Generate SQL
         sql_statements = []
@@ -91,23 +102,24 @@ class PostgreSQLBuilder(BaseSourceBuilder):
         if not dry_run and sql_statements:
             try:
                 # Execute source creation
-                source_result = self.rw_client.execute_sql(sql_statements[0])
+                self.rw_client.execute(sql_statements[0])
                 execution_results.append({
                     "sql": sql_statements[0],
-                    "success": source_result.get("success", True),
-                    "message": source_result.get("message", "Source created")
+                    "success": True,
+                    "message": "Source created"
                 })
 
                 # Execute table creations
                 for i, table_sql in enumerate(sql_statements[1:], 1):
                     try:
-                        table_result = self.rw_client.execute_sql(table_sql)
+                        self.rw_client.execute(table_sql)
                         execution_results.append({
                             "sql": table_sql,
-                            "success": table_result.get("success", True),
-                            "message": table_result.get("message", f"Table {i} created")
+                            "success": True,
+                            "message": f"Table {i} created"
                         })
                     except Exception as e:
+                        self.clear_discovery_cache()
                         execution_results.append({
                             "sql": table_sql,
                             "success": False,
@@ -115,6 +127,7 @@ class PostgreSQLBuilder(BaseSourceBuilder):
                         })
 
             except Exception as e:
+                self.clear_discovery_cache()
                 logger.error(f"Failed to execute source SQL: {e}")
                 execution_results.append({
                     "sql": sql_statements[0],
@@ -142,29 +155,77 @@ class PostgreSQLBuilder(BaseSourceBuilder):
         schema_name: Optional[str] = None
     ) -> List[TableInfo]:
         """Discover available tables in PostgreSQL database."""
-        discovery = PostgreSQLDiscovery(config)
+        schema_name = schema_name or config.schema_name
 
-        connection_test = discovery.test_connection()
-        if not connection_test.get("success"):
-            raise ConnectionError(
-                f"Cannot connect to PostgreSQL at {config.hostname}:{config.port}. "
-                f"Error: {connection_test.get('message', 'Unknown error')}"
-            )
+        def fetch() -> Tuple[TableInfo, ...]:
+            with PostgreSQLDiscovery(config) as discovery, self._connection_errors(config):
+                return tuple(discovery.list_tables(schema_name))
 
-        return discovery.list_tables(schema_name or config.schema_name)
+        # Cache an immutable tuple; each caller gets its own list
+        return list(self._cached(
+            config.connection_key() + ("tables", schema_name), fetch))
 
     def get_schemas(self, config: PostgreSQLConfig) -> List[str]:
         """Get list of available schemas in PostgreSQL database."""
-        discovery = PostgreSQLDiscovery(config)
-
-        connection_test = discovery.test_connection()
-        if not connection_test.get("success"):
+        def fetch() -> Tuple[str, ...]:
+            with PostgreSQLDiscovery(config) as discovery, self._connection_errors(config):
+                return tuple(discovery.list_schemas())
+
+        return list(self._cached(config.connection_key() + ("schemas",), fetch))
+
+    @staticmethod
+    @contextmanager
+    def _connection_errors(config: PostgreSQLConfig):
+        """Report connection failures from discovery queries as ConnectionError.
+
+        Used instead of a separate test_connection() probe, which would cost
+        an extra round trip before the real query.
+        """
+        try:
+            yield
+        except psycopg.OperationalError as e:
             raise ConnectionError(
                 f"Cannot connect to PostgreSQL at {config.hostname}:{config.port}. "
-                f"Error: {connection_test.get('message', 'Unknown error')}"
-            )
+                f"Error: {e}"
+            ) from e
 
-        return discovery.list_schemas()
+    def _select_tables(
+        self,
+        discovery: PostgreSQLDiscovery,
+        config: PostgreSQLConfig,
+        table_selector: Optional[TableSelector],
+        dry_run: bool
+    ) -> List[TableInfo]:
+        """Discover and select tables for the given selector."""
+        if self._is_pattern_selection(table_selector) and not dry_run:
+            # Stream discovered tables through the selector without
+            # materializing the full schema listing first
+            logger.info(
+                "Discovering all tables in schema '%s'...", config.schema_name)
+            selector = table_selector or TableSelector(include_all=True)
+            return list(selector.select_stream(
+                discovery.iter_tables(config.schema_name)))
+
+        # Get available tables
+        available_tables = self._get_available_tables(
+            discovery, config, table_selector, dry_run)
+
+        logger.info("Found %d tables", len(available_tables))
+
+        # Select tables: if table_selector is not specified, include all source tables
+        if table_selector is None:
+            table_selector = TableSelector(include_all=True)
+
+        return table_selector.select_tables(available_tables)
+
+    @staticmethod
+    def _is_pattern_selection(
+        table_selector: Optional[Union[TableSelector, List[str]]]
+    ) -> bool:
+        """Whether selection is pattern based rather than a specific table list."""
+        if table_selector is None:
+            return True
+        return isinstance(table_selector, TableSelector) and not table_selector.specific_tables
 
     def _get_available_tables(
         self,
@@ -179,7 +240,7 @@ class PostgreSQLBuilder(BaseSourceBuilder):
             # User provided specific tables - only check if those tables exist (skip in dry_run mode)
             if not dry_run:
                 logger.info(
-                    f"Checking existence of {len(table_selector.specific_tables)} specific tables...")
+                    "Checking existence of %d specific tables...", len(table_selector.specific_tables))
                 available_tables = discovery.check_specific_tables(
                     table_selector.specific_tables, config.schema_name)
 
@@ -208,7 +269,7 @@ class PostgreSQLBuilder(BaseSourceBuilder):
             # table_selector is a list of table names - only check those specific tables (skip in dry_run mode)
             if not dry_run:
                 logger.info(
-                    f"Checking existence of {len(table_selector)} specific tables...")
+                    "Checking existence of %d specific tables...", len(table_selector))
                 available_tables = discovery.check_specific_tables(
                     table_selector, config.schema_name)
 
@@ -236,7 +297,7 @@ class PostgreSQLBuilder(BaseSourceBuilder):
             # No specific tables provided - discover all tables in schema (skip in dry_run mode)
             if not dry_run:
                 logger.info(
-                    f"Discovering all tables in schema '{config.schema_name}'...")
+                    "Discovering all tables in schema '%s'...", config.schema_name)
                 available_tables = discovery.list_tables(config.schema_name)
             else:
                 # In dry_run mode, create mock tables for demonstration
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 
 from .base import BaseSinkBuilder
-from ..sinks.base import SinkConfig, SinkResult
+from ..client import RisingWaveClient
+from ..discovery.base import _NAME_TRANSLATE
+from ..sinks.base import SinkConfig, SinkPipeline, SinkResult
 from ..sinks.s3 import S3Config, S3Sink
 from ..sinks.postgresql import PostgreSQLSinkConfig, PostgreSQLSink
 from ..sinks.iceberg import IcebergConfig, IcebergSink
@@ -14,213 +18,174 @@ from ..sinks.elasticsearch import ElasticsearchConfig, ElasticsearchSink
 
 logger = logging.getLogger(__name__)
 
+# Default upper bound on CREATE SINK statements sent to RisingWave concurrently
+_MAX_SINK_WORKERS = 16
+
 
 class SinkBuilder(BaseSinkBuilder):
-    """Universal sink builder for all sink types."""
+    """Universal sink builder for all sink types.
+
+    Sink SQL for multiple tables is executed on one thread pool shared by
+    every create_sink call, including concurrent ones from
+    ConnectBuilder.acreate_sinks, so ``max_inflight`` caps the statements in
+    flight against RisingWave for the whole builder.
+    """
+
+    def __init__(self, rw_client: RisingWaveClient, max_inflight: Optional[int] = None):
+        super().__init__(rw_client)
+        if max_inflight is None:
+            max_inflight = _MAX_SINK_WORKERS
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
+        self.max_inflight = max_inflight
+        # Shared by all create_sink calls; started on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the worker threads used to execute sink SQL."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared executor, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_inflight, thread_name_prefix="rw-sink")
+            return self._executor
 
     def create_sink(
         self,
         sink_config: Union[S3Config, PostgreSQLSinkConfig, IcebergConfig, ElasticsearchConfig],
         source_tables: List[str],
         select_queries: Optional[Dict[str, str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a sink based on the config type."""
-        if isinstance(sink_config, S3Config):
-            return self._create_s3_sink(sink_config, source_tables, select_queries, dry_run)
-        elif isinstance(sink_config, PostgreSQLSinkConfig):
-            return self._create_postgresql_sink(sink_config, source_tables, select_queries, dry_run)
-        elif isinstance(sink_config, IcebergConfig):
-            return self._create_iceberg_sink(sink_config, source_tables, select_queries, dry_run)
-        elif isinstance(sink_config, ElasticsearchConfig):
-            return self._create_elasticsearch_sink(sink_config, source_tables, select_queries, dry_run)
-        else:
+        """Create a sink based on the config type.
+
+        ``custom_query`` is a shortcut for sinking a single source table
+        through one SELECT without wrapping it in ``select_queries``.
+        """
+        if custom_query is not None and len(source_tables) != 1:
             raise ValueError(
-                f"Unsupported sink config type: {type(sink_config)}")
+                "custom_query requires exactly one source table; use select_queries for multiple tables")
+        create = _SINK_CREATORS.get(type(sink_config))
+        if create is None:
+            # Fall back to isinstance checks for config subclasses
+            create = next((creator for config_cls, creator in _SINK_CREATORS.items()
+                           if isinstance(sink_config, config_cls)), None)
+            if create is None:
+                raise ValueError(
+                    f"Unsupported sink config type: {type(sink_config)}")
+        return create(self, sink_config, source_tables, select_queries, dry_run, custom_query)
+
+    def _execute_sink_results(self, sink_results: List[SinkResult]) -> None:
+        """Execute generated sink SQL, recording the outcome on each result.
+
+        Each table gets its own sink name, so the statements are independent
+        and are sent to RisingWave from the builder's shared thread pool.
+        """
+        pending = [result for result in sink_results if result.success]
+        if len(pending) <= 1:
+            for result in pending:
+                self._execute_sink_result(result)
+            return
+
+        # Consume the iterator so every statement has finished on return
+        list(self._get_executor().map(self._execute_sink_result, pending))
+
+    def _execute_sink_result(self, result: SinkResult) -> None:
+        """Execute one sink statement using rw_client and update its result."""
+        start_time = time.time()
+        try:
+            self.rw_client.execute(result.sql_statement)
+            result.execution_time = time.time() - start_time
+            result.message = "Sink created successfully"
+        except Exception as exec_error:
+            result.success = False
+            result.error_message = f"SQL execution failed: {str(exec_error)}"
+            result.execution_time = time.time() - start_time
 
     def _create_s3_sink(
         self,
         s3_config: S3Config,
         source_tables: List[str],
         select_queries: Optional[Dict[str, str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create S3 sink."""
-        sink = S3Sink(s3_config)
-
-        sink_results = []
-        sql_statements = []
-
-        for table_name in source_tables:
-            try:
-                select_query = select_queries.get(
-                    table_name) if select_queries else None
-
-                if dry_run:
-                    # Generate SQL without executing
-                    sql = sink.create_sink_sql(table_name, select_query)
-                    sql_statements.append(sql)
-                    sink_results.append(SinkResult(
-                        sink_name=f"{s3_config.sink_name}_{table_name}",
-                        sink_type=s3_config.sink_type,
-                        sql_statement=sql,
-                        source_table=table_name,
-                        success=True,
-                        message="Dry run - SQL generated",
-                        execution_time=0.0
-                    ))
-                else:
-                    # Execute sink creation
-                    result = sink.create_sink(table_name, select_query)
-                    if result.success:
-                        # Execute the SQL using rw_client
-                        start_time = time.time()
-                        try:
-                            self.rw_client.execute_sql(result.sql_statement)
-                            execution_time = time.time() - start_time
-                            result.execution_time = execution_time
-                            result.message = "Sink created successfully"
-                        except Exception as exec_error:
-                            execution_time = time.time() - start_time
-                            result.success = False
-                            result.error_message = f"SQL execution failed: {str(exec_error)}"
-                            result.execution_time = execution_time
-
-                    sink_results.append(result)
-                    sql_statements.append(result.sql_statement)
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to create S3 sink for table {table_name}: {e}")
-                sink_results.append(SinkResult(
-                    sink_name=f"{s3_config.sink_name}_{table_name}",
-                    success=False,
-                    sql_statement="",
-                    message=f"Failed to create sink: {str(e)}",
-                    execution_time=0.0
-                ))
-
-        successful_results = [r for r in sink_results if r.success]
-        failed_results = [r for r in sink_results if not r.success]
-
-        return {
-            "success_summary": {
-                "overall_success": len(failed_results) == 0,
-                "total_sinks": len(sink_results),
-                "successful_sinks": len(successful_results),
-                "failed_sinks": len(failed_results)
-            },
-            "sink_results": successful_results,
-            "failed_results": failed_results,
-            "sql_statements": sql_statements,
-            "dry_run": dry_run,
-            "executed": not dry_run
-        }
+        return self._create_table_sinks(
+            S3Sink(s3_config), "S3", source_tables, select_queries, dry_run, custom_query)
 
     def _create_postgresql_sink(
         self,
         pg_sink_config: PostgreSQLSinkConfig,
         source_tables: List[str],
         select_queries: Optional[Dict[str, str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create PostgreSQL sink."""
-        sink = PostgreSQLSink(pg_sink_config)
-
-        sink_results = []
-        sql_statements = []
-
-        for table_name in source_tables:
-            try:
-                select_query = select_queries.get(
-                    table_name) if select_queries else None
-
-                if dry_run:
-                    # Generate SQL without executing
-                    sql = sink.create_sink_sql(table_name, select_query)
-                    sql_statements.append(sql)
-                    sink_results.append(SinkResult(
-                        sink_name=f"{pg_sink_config.sink_name}_{table_name}",
-                        sink_type=pg_sink_config.sink_type,
-                        sql_statement=sql,
-                        source_table=table_name,
-                        success=True,
-                        message="Dry run - SQL generated",
-                        execution_time=0.0
-                    ))
-                else:
-                    # Execute sink creation
-                    result = sink.create_sink(table_name, select_query)
-                    if result.success:
-                        # Execute the SQL using rw_client
-                        start_time = time.time()
-                        try:
-                            self.rw_client.execute_sql(result.sql_statement)
-                            execution_time = time.time() - start_time
-                            result.execution_time = execution_time
-                            result.message = "Sink created successfully"
-                        except Exception as exec_error:
-                            execution_time = time.time() - start_time
-                            result.success = False
-                            result.error_message = f"SQL execution failed: {str(exec_error)}"
-                            result.execution_time = execution_time
-
-                    sink_results.append(result)
-                    sql_statements.append(result.sql_statement)
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to create PostgreSQL sink for table {table_name}: {e}")
-                sink_results.append(SinkResult(
-                    sink_name=f"{pg_sink_config.sink_name}_{table_name}",
-                    success=False,
-                    sql_statement="",
-                    message=f"Failed to create sink: {str(e)}",
-                    execution_time=0.0
-                ))
-
-        successful_results = [r for r in sink_results if r.success]
-        failed_results = [r for r in sink_results if not r.success]
-
-        return {
-            "success_summary": {
-                "overall_success": len(failed_results) == 0,
-                "total_sinks": len(sink_results),
-                "successful_sinks": len(successful_results),
-                "failed_sinks": len(failed_results)
-            },
-            "sink_results": successful_results,
-            "failed_results": failed_results,
-            "sql_statements": sql_statements,
-            "dry_run": dry_run,
-            "executed": not dry_run
-        }
+        return self._create_table_sinks(
+            PostgreSQLSink(pg_sink_config), "PostgreSQL", source_tables, select_queries, dry_run, custom_query)
 
     def _create_iceberg_sink(
         self,
         iceberg_config: IcebergConfig,
         source_tables: List[str],
         select_queries: Optional[Dict[str, str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create Iceberg sink."""
-        sink = IcebergSink(iceberg_config)
+        return self._create_table_sinks(
+            IcebergSink(iceberg_config), "Iceberg", source_tables, select_queries, dry_run, custom_query)
 
+    def _create_table_sinks(
+        self,
+        sink: SinkPipeline,
+        label: str,
+        source_tables: List[str],
+        select_queries: Optional[Dict[str, str]] = None,
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create one sink per source table with an already-built sink pipeline.
+
+        With several tables each sink is named ``<sink_name>_<table>`` so the
+        CREATE SINK statements do not collide when executed concurrently.
+        """
+        config = sink.config
         sink_results = []
         sql_statements = []
 
         for table_name in source_tables:
+            table_config, table_sink = config, sink
             try:
-                select_query = select_queries.get(
-                    table_name) if select_queries else None
+                if len(source_tables) > 1:
+                    # Name each table's sink on a copy instead of mutating the shared config
+                    table_config = config.model_copy(update={
+                        "sink_name": f"{config.sink_name}_{table_name.translate(_NAME_TRANSLATE)}"})
+                    table_sink = type(sink)(table_config)
+
+                if custom_query is not None:
+                    select_query = custom_query
+                else:
+                    select_query = select_queries.get(
+                        table_name) if select_queries else None
 
                 if dry_run:
                     # Generate SQL without executing
-                    sql = sink.create_sink_sql(table_name, select_query)
+                    sql = table_sink.create_sink_sql(table_name, select_query)
                     sql_statements.append(sql)
                     sink_results.append(SinkResult(
-                        sink_name=f"{iceberg_config.sink_name}_{table_name}",
-                        sink_type=iceberg_config.sink_type,
+                        sink_name=table_config.sink_name,
+                        sink_type=table_config.sink_type,
                         sql_statement=sql,
                         source_table=table_name,
                         success=True,
@@ -228,36 +193,27 @@ class SinkBuilder(BaseSinkBuilder):
                         execution_time=0.0
                     ))
                 else:
-                    # Execute sink creation
-                    result = sink.create_sink(table_name, select_query)
-                    if result.success:
-                        # Execute the SQL using rw_client
-                        start_time = time.time()
-                        try:
-                            self.rw_client.execute_sql(result.sql_statement)
-                            execution_time = time.time() - start_time
-                            result.execution_time = execution_time
-                            result.message = "Sink created successfully"
-                        except Exception as exec_error:
-                            execution_time = time.time() - start_time
-                            result.success = False
-                            result.error_message = f"SQL execution failed: {str(exec_error)}"
-                            result.execution_time = execution_time
-
+                    # Generate sink SQL; it is executed for all tables below
+                    result = table_sink.create_sink(table_name, select_query)
                     sink_results.append(result)
                     sql_statements.append(result.sql_statement)
 
             except Exception as e:
                 logger.error(
-                    f"Failed to create Iceberg sink for table {table_name}: {e}")
+                    f"Failed to create {label} sink for table {table_name}: {e}")
                 sink_results.append(SinkResult(
-                    sink_name=f"{iceberg_config.sink_name}_{table_name}",
+                    sink_name=table_config.sink_name,
+                    sink_type=table_config.sink_type,
+                    source_table=table_name,
                     success=False,
                     sql_statement="",
                     message=f"Failed to create sink: {str(e)}",
                     execution_time=0.0
                 ))
 
+        if not dry_run:
+            self._execute_sink_results(sink_results)
+
         successful_results = [r for r in sink_results if r.success]
         failed_results = [r for r in sink_results if not r.success]
 
@@ -280,7 +236,8 @@ class SinkBuilder(BaseSinkBuilder):
         elasticsearch_config: ElasticsearchConfig,
         source_tables: List[str],
         select_queries: Optional[Dict[str, str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create Elasticsearch sink."""
         sink = ElasticsearchSink(elasticsearch_config)
@@ -292,20 +249,25 @@ class SinkBuilder(BaseSinkBuilder):
             start_time = time.time()
             
             try:
-                # Update sink name for this specific table
+                table_config, table_sink = elasticsearch_config, sink
                 if len(source_tables) > 1:
-                    # For multiple tables, append table name to sink name
+                    # For multiple tables, append table name to sink name on a
+                    # shallow copy instead of mutating the shared config
                     table_clean = table_name.replace('-', '_').replace('.', '_').replace(' ', '_')
-                    original_name = elasticsearch_config.sink_name
-                    elasticsearch_config.sink_name = f"{original_name}_{table_clean}"
+                    table_config = elasticsearch_config.model_copy(update={
+                        "sink_name": f"{elasticsearch_config.sink_name}_{table_clean}"})
+                    table_sink = ElasticsearchSink(table_config)
 
                 # Check if we have a custom select query for this table
-                select_query = select_queries.get(table_name) if select_queries else None
+                if custom_query is not None:
+                    select_query = custom_query
+                else:
+                    select_query = select_queries.get(table_name) if select_queries else None
                 
                 if select_query:
-                    sql = sink.create_sink_sql(select_query=select_query)
+                    sql = table_sink.create_sink_sql(select_query=select_query)
                 else:
-                    sql = sink.create_sink_sql(source_name=table_name)
+                    sql = table_sink.create_sink_sql(source_name=table_name)
 
                 sql_statements.append(sql)
 
@@ -318,32 +280,29 @@ class SinkBuilder(BaseSinkBuilder):
                             set_statement = sql_parts[0]
                             create_sink_statement = '\n\n'.join(sql_parts[1:])
                             
-                            # Execute SET statement first
-                            self.execute_sql(set_statement)
-                            # Then execute CREATE SINK statement
-                            self.execute_sql(create_sink_statement)
+                            # SET is session-scoped, so run both statements
+                            # over the same connection, SET first
+                            self.rw_client.execute_many(
+                                [set_statement, create_sink_statement])
                         else:
-                            self.execute_sql(sql)
+                            self.rw_client.execute(sql)
                     else:
-                        self.execute_sql(sql)
+                        self.rw_client.execute(sql)
 
                 execution_time = time.time() - start_time
 
                 sink_results.append(SinkResult(
-                    sink_name=elasticsearch_config.sink_name,
+                    sink_name=table_config.sink_name,
                     success=True,
                     sql_statement=sql,
                     message=f"Successfully created Elasticsearch sink for {table_name}",
                     execution_time=execution_time
                 ))
 
-                logger.info(
-                    f"Successfully created Elasticsearch sink '{elasticsearch_config.sink_name}' for table '{table_name}'"
-                )
-
-                # Reset sink name for next iteration
-                if len(source_tables) > 1:
-                    elasticsearch_config.sink_name = original_name
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Successfully created Elasticsearch sink '%s' for table '%s'",
+                        table_config.sink_name, table_name)
 
             except Exception as e:
                 logger.error(
@@ -372,3 +331,12 @@ class SinkBuilder(BaseSinkBuilder):
             "dry_run": dry_run,
             "executed": not dry_run
         }
+
+
+# Sink creation method per config type, resolved once per create_sink call
+_SINK_CREATORS = {
+    S3Config: SinkBuilder._create_s3_sink,
+    PostgreSQLSinkConfig: SinkBuilder._create_postgresql_sink,
+    IcebergConfig: SinkBuilder._create_iceberg_sink,
+    ElasticsearchConfig: SinkBuilder._create_elasticsearch_sink,
+}
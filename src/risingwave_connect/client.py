@@ -3,7 +3,7 @@
 from __future__ import annotations
 import logging
 from contextlib import contextmanager
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Iterable, Optional
 from urllib.parse import quote, urlencode
 
 import psycopg
@@ -119,11 +119,48 @@ class RisingWaveClient:
             sql: SQL statement to execute
             params: Optional parameters for the SQL statement
         """
-        logger.info(f"Executing SQL: {sql}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing SQL: %s", sql)
         with self.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, params)
 
+    def execute_many(self, statements: Iterable[str]) -> int:
+        """Execute several SQL statements in order over one connection.
+
+        Unlike calling execute() per statement, the connection (and its TLS
+        handshake) is set up once for the whole batch. Statements are sent
+        one at a time rather than joined into a single query string, so DDL
+        is not wrapped in an implicit transaction and a failure can be
+        traced to the statement that caused it.
+
+        Args:
+            statements: SQL statements to execute
+
+        Returns:
+            Number of statements executed
+
+        Raises:
+            psycopg.Error: From the first failing statement; later statements
+                are not executed
+        """
+        executed = 0
+        # Checked once per batch rather than per statement
+        log_statements = logger.isEnabledFor(logging.INFO)
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                for sql in statements:
+                    if log_statements:
+                        logger.info("Executing SQL: %s", sql)
+                    try:
+                        cur.execute(sql)
+                    except psycopg.Error as e:
+                        logger.error(
+                            "Statement %d of batch failed: %s", executed + 1, e)
+                        raise
+                    executed += 1
+        return executed
+
     def fetch_all(self, sql: str, params: Optional[tuple] = None) -> list[tuple]:
         """Execute SQL and fetch all results.
 
@@ -134,7 +171,8 @@ class RisingWaveClient:
         Returns:
             List of result tuples
         """
-        logger.debug(f"Fetching SQL: {sql}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching SQL: %s", sql)
         with self.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, params)
@@ -150,7 +188,8 @@ class RisingWaveClient:
         Returns:
             Single result tuple or None
         """
-        logger.debug(f"Fetching one SQL: {sql}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching one SQL: %s", sql)
         with self.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, params)
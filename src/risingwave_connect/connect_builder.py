@@ -1,7 +1,9 @@
 """Streamlined connection builder using modular builders."""
 
 from __future__ import annotations
+import asyncio
 import logging
+import warnings
 from typing import Dict, List, Optional, Any, Union
 
 from .client import RisingWaveClient
@@ -30,7 +32,12 @@ logger = logging.getLogger(__name__)
 class ConnectBuilder:
     """High-level connection builder using modular components."""
 
-    def __init__(self, rw_client: RisingWaveClient):
+    def __init__(self, rw_client: RisingWaveClient, max_inflight_sinks: Optional[int] = None):
+        """Create a builder.
+
+        ``max_inflight_sinks`` caps the CREATE SINK statements executed
+        concurrently across all create_sink and acreate_sinks calls.
+        """
         self.rw_client = rw_client
 
         # Initialize specialized builders
@@ -39,13 +46,23 @@ class ConnectBuilder:
         self._sqlserver_builder = SQLServerBuilder(rw_client)
         self._kafka_builder = KafkaBuilder(rw_client)
         self._mysql_builder = MySQLBuilder(rw_client)
-        self._sink_builder = SinkBuilder(rw_client)
+        self._sink_builder = SinkBuilder(rw_client, max_inflight=max_inflight_sinks)
+
+    def __enter__(self) -> "ConnectBuilder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release worker threads held by the sink builder."""
+        self._sink_builder.close()
 
     # PostgreSQL Methods
     def create_postgresql_connection(
         self,
         config: PostgreSQLConfig,
-        table_selector: Optional[Union[TableSelector, List[str]]] = None,
+        table_selector: Optional[Union[TableSelector, List[str], List[TableInfo]]] = None,
         column_configs: Optional[Dict[str, TableColumnConfig]] = None,
         dry_run: bool = False
     ) -> Dict[str, Any]:
@@ -181,10 +198,45 @@ class ConnectBuilder:
         sink_config: Union[S3Config, PostgreSQLSinkConfig, IcebergConfig],
         source_tables: List[str],
         select_queries: Optional[Dict[str, str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        custom_query: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a sink based on the config type."""
-        return self._sink_builder.create_sink(sink_config, source_tables, select_queries, dry_run)
+        """Create a sink based on the config type.
+
+        Pass ``custom_query`` instead of ``select_queries`` when sinking a
+        single source table through one SELECT.
+        """
+        return self._sink_builder.create_sink(
+            sink_config, source_tables, select_queries, dry_run, custom_query)
+
+    async def acreate_sinks(
+        self,
+        sink_configs: List[Union[S3Config, PostgreSQLSinkConfig, IcebergConfig]],
+        source_tables: List[str],
+        select_queries: Optional[Dict[str, str]] = None,
+        dry_run: bool = False,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Create several sinks over the same source tables concurrently.
+
+        Each sink is created by create_sink() on a worker thread, with at most
+        max_concurrency in flight. Their statements share the sink builder's
+        pool, so max_inflight_sinks still bounds the load on RisingWave.
+        Results are returned in sink_configs order.
+        """
+        if len(sink_configs) == 1:
+            # Nothing to bound or gather for a single sink
+            return [await asyncio.to_thread(
+                self.create_sink, sink_configs[0], source_tables, select_queries, dry_run)]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(sink_config):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.create_sink, sink_config, source_tables, select_queries, dry_run)
+
+        return list(await asyncio.gather(*(run(sink_config) for sink_config in sink_configs)))
 
     def create_s3_sink(
         self,
@@ -207,27 +259,37 @@ class ConnectBuilder:
         return self._sink_builder._create_postgresql_sink(pg_sink_config, source_tables, select_queries, dry_run)
 
 
+def _warn_include_all_ignored(name: str, value: Optional[bool], specific_name: str) -> None:
+    """Warn that a convenience function's include-all flag has no effect."""
+    if value is not None:
+        warnings.warn(
+            f"{name} is deprecated and has no effect: everything not excluded "
+            f"is selected unless {specific_name} is given",
+            DeprecationWarning,
+            stacklevel=3
+        )
+
+
 # Convenience functions for backward compatibility
 def create_postgresql_cdc_source_connection(
     rw_client: RisingWaveClient,
     pg_config: PostgreSQLConfig,
-    include_all_tables: bool = False,
+    include_all_tables: Optional[bool] = None,
     include_tables: Optional[List[str]] = None,
     exclude_tables: Optional[List[str]] = None,
     dry_run: bool = False
 ) -> Dict[str, Any]:
     """Convenience function to create PostgreSQL CDC source connection."""
+    _warn_include_all_ignored("include_all_tables", include_all_tables, "include_tables")
     builder = ConnectBuilder(rw_client)
 
     # Create table selector
     if include_tables:
         selector = TableSelector(specific_tables=include_tables)
-    elif include_all_tables:
-        selector = TableSelector(
-            include_all=True, exclude_patterns=exclude_tables or [])
     else:
+        # Everything not excluded is selected
         selector = TableSelector(
-            include_patterns=["*"], exclude_patterns=exclude_tables or [])
+            include_all=True, exclude_patterns=exclude_tables or [])
 
     return builder.create_postgresql_connection(pg_config, selector, dry_run)
 
@@ -235,7 +297,7 @@ def create_postgresql_cdc_source_connection(
 def create_mongodb_cdc_source_connection(
     rw_client: RisingWaveClient,
     mongodb_config: MongoDBConfig,
-    include_all_collections: bool = False,
+    include_all_collections: Optional[bool] = None,
     include_collections: Optional[List[str]] = None,
     exclude_collections: Optional[List[str]] = None,
     include_commit_timestamp: bool = False,
@@ -244,17 +306,16 @@ def create_mongodb_cdc_source_connection(
     dry_run: bool = False
 ) -> Dict[str, Any]:
     """Convenience function to create MongoDB CDC source connection."""
+    _warn_include_all_ignored("include_all_collections", include_all_collections, "include_collections")
     builder = ConnectBuilder(rw_client)
 
     # Create table selector
     if include_collections:
         selector = TableSelector(specific_tables=include_collections)
-    elif include_all_collections:
-        selector = TableSelector(
-            include_all=True, exclude_patterns=exclude_collections or [])
     else:
+        # Everything not excluded is selected
         selector = TableSelector(
-            include_patterns=["*"], exclude_patterns=exclude_collections or [])
+            include_all=True, exclude_patterns=exclude_collections or [])
 
     return builder.create_mongodb_connection(
         mongodb_config, selector, dry_run,
@@ -267,7 +328,7 @@ def create_mongodb_cdc_source_connection(
 def create_sqlserver_cdc_source_connection(
     rw_client: RisingWaveClient,
     sqlserver_config: SQLServerConfig,
-    include_all_tables: bool = False,
+    include_all_tables: Optional[bool] = None,
     include_tables: Optional[List[str]] = None,
     exclude_tables: Optional[List[str]] = None,
     column_configs: Optional[Dict[str, TableColumnConfig]] = None,
@@ -278,17 +339,16 @@ def create_sqlserver_cdc_source_connection(
     dry_run: bool = False
 ) -> Dict[str, Any]:
     """Convenience function to create SQL Server CDC source connection."""
+    _warn_include_all_ignored("include_all_tables", include_all_tables, "include_tables")
     builder = ConnectBuilder(rw_client)
 
     # Create table selector
     if include_tables:
         selector = TableSelector(specific_tables=include_tables)
-    elif include_all_tables:
-        selector = TableSelector(
-            include_all=True, exclude_patterns=exclude_tables or [])
     else:
+        # Everything not excluded is selected
         selector = TableSelector(
-            include_patterns=["*"], exclude_patterns=exclude_tables or [])
+            include_all=True, exclude_patterns=exclude_tables or [])
 
     return builder.create_sqlserver_connection(
         sqlserver_config, selector, column_configs, dry_run,
@@ -325,7 +385,7 @@ def create_kafka_source_connection(
 def create_mysql_cdc_source_connection(
     rw_client: RisingWaveClient,
     mysql_config: MySQLConfig,
-    include_all_tables: bool = False,
+    include_all_tables: Optional[bool] = None,
     include_tables: Optional[List[str]] = None,
     exclude_tables: Optional[List[str]] = None,
     column_configs: Optional[Dict[str, TableColumnConfig]] = None,
@@ -338,17 +398,16 @@ def create_mysql_cdc_source_connection(
     dry_run: bool = False
 ) -> Dict[str, Any]:
     """Convenience function to create MySQL CDC source connection."""
+    _warn_include_all_ignored("include_all_tables", include_all_tables, "include_tables")
     builder = ConnectBuilder(rw_client)
 
     # Create table selector
     if include_tables:
         selector = TableSelector(specific_tables=include_tables)
-    elif include_all_tables:
-        selector = TableSelector(
-            include_all=True, exclude_patterns=exclude_tables or [])
     else:
+        # Everything not excluded is selected
         selector = TableSelector(
-            include_patterns=["*"], exclude_patterns=exclude_tables or [])
+            include_all=True, exclude_patterns=exclude_tables or [])
 
     return builder.create_mysql_connection(
         mysql_config, selector, column_configs, dry_run,
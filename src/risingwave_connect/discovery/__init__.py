@@ -1,3 +1,5 @@
 """Discovery module for database introspection."""
 
+from .base import DatabaseDiscovery, TableSelector, TableInfo, ColumnInfo
+
 __all__ = ["DatabaseDiscovery", "TableSelector", "TableInfo", "ColumnInfo"]
@@ -1,30 +1,53 @@
 """Base classes for database discovery and source management."""
 
 from __future__ import annotations
+import fnmatch
+import functools
+import hashlib
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Any, Tuple
+from dataclasses import dataclass, field
 
 from pydantic import BaseModel
 
 
-@dataclass
+# Characters replaced with underscores when deriving source names
+_NAME_TRANSLATE = str.maketrans('-. ', '___')
+
+
+@dataclass(slots=True, frozen=True)
 class TableInfo:
-    """Information about a discoverable table."""
+    """Information about a discoverable table.
+
+    Frozen so the names derived in __post_init__ cannot go stale; use
+    dataclasses.replace() to get a modified copy.
+    """
     schema_name: str
     table_name: str
     table_type: str = "BASE TABLE"  # BASE TABLE, VIEW, etc.
     row_count: Optional[int] = None
     size_bytes: Optional[int] = None
     comment: Optional[str] = None
+    _qualified_name: str = field(init=False, repr=False, compare=False)
+    # Lowercased names used by TableSelector pattern matching
+    _qualified_name_lower: str = field(init=False, repr=False, compare=False)
+    _table_name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        qualified_name = f"{self.schema_name}.{self.table_name}"
+        object.__setattr__(self, "_qualified_name", qualified_name)
+        object.__setattr__(self, "_qualified_name_lower", qualified_name.lower())
+        object.__setattr__(self, "_table_name_lower", self.table_name.lower())
 
     @property
     def qualified_name(self) -> str:
         """Get fully qualified table name."""
-        return f"{self.schema_name}.{self.table_name}"
+        return self._qualified_name
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnInfo:
     """Information about a table column."""
     column_name: str
@@ -35,7 +58,7 @@ class ColumnInfo:
     ordinal_position: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnSelection:
     """Column selection specification for table creation."""
     column_name: str
@@ -44,7 +67,7 @@ class ColumnSelection:
     is_nullable: Optional[bool] = None  # Override nullability if needed
 
 
-@dataclass
+@dataclass(slots=True)
 class TableColumnConfig:
     """Table configuration with column-level filtering."""
     table_info: TableInfo
@@ -80,22 +103,19 @@ class TableSelector:
         if self.specific_tables:
             # Use specific table list - include even tables that don't exist yet
             selected = []
-            available_table_names = {
-                table.table_name for table in available_tables}
-            available_qualified_names = {
-                table.qualified_name for table in available_tables}
+            by_qualified_name = {}
+            by_table_name = {}
+            for table in available_tables:
+                by_qualified_name.setdefault(table.qualified_name, table)
+                by_table_name.setdefault(table.table_name, table)
 
             for table_name in self.specific_tables:
                 # First try to find the table in available tables
-                found = False
-                for table in available_tables:
-                    if table.qualified_name == table_name or table.table_name == table_name:
-                        selected.append(table)
-                        found = True
-                        break
-
-                # If not found, create a placeholder TableInfo for tables that might not exist yet
-                if not found:
+                table = by_qualified_name.get(table_name) or by_table_name.get(table_name)
+                if table is not None:
+                    selected.append(table)
+                else:
+                    # Create a placeholder TableInfo for tables that might not exist yet
                     # Assume it's in the 'public' schema if no schema specified
                     if '.' in table_name:
                         schema_name, table_name_only = table_name.split('.', 1)
@@ -115,36 +135,100 @@ class TableSelector:
 
             return selected
 
-        if self.include_all:
-            selected = available_tables.copy()
-        else:
-            # Start with empty and add matches
-            selected = []
-            for table in available_tables:
-                for pattern in self.include_patterns:
-                    if self._matches_pattern(table.qualified_name, pattern) or self._matches_pattern(table.table_name, pattern):
-                        selected.append(table)
-                        break
-
-        # Remove excluded tables
-        if self.exclude_patterns:
-            filtered = []
-            for table in selected:
-                should_exclude = False
-                for pattern in self.exclude_patterns:
-                    if self._matches_pattern(table.qualified_name, pattern) or self._matches_pattern(table.table_name, pattern):
-                        should_exclude = True
-                        break
-                if not should_exclude:
-                    filtered.append(table)
-            selected = filtered
-
-        return selected
-
-    def _matches_pattern(self, name: str, pattern: str) -> bool:
-        """Check if name matches pattern (supports * wildcards)."""
-        import fnmatch
-        return fnmatch.fnmatch(name.lower(), pattern.lower())
+        return list(self.select_stream(available_tables))
+
+    def select_stream(self, tables: Iterable[TableInfo]) -> Iterator[TableInfo]:
+        """Yield tables matching the include/exclude patterns as they arrive.
+
+        Specific table lists need the full input to resolve placeholders, so
+        they are handled by select_tables() only.
+        """
+        include_all = self.include_all
+        # Read the patterns per call so later edits to the public lists apply;
+        # the tuples key the cached _compile_patterns regexes
+        include_key = tuple(self.include_patterns)
+        exclude_key = tuple(self.exclude_patterns)
+
+        # Apply include and exclude patterns in a single pass
+        for table in tables:
+            if _is_selected(table._qualified_name_lower, table._table_name_lower,
+                            include_key, exclude_key, include_all):
+                yield table
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile glob patterns into one case-insensitive alternation regex."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p.lower()) for p in patterns))
+
+
+def _matches_any(qualified_name: str, table_name: str, patterns: Tuple[str, ...]) -> bool:
+    """Check if a lowercased qualified or bare name matches any glob pattern."""
+    rx = _compile_patterns(patterns)
+    return rx is not None and (rx.match(qualified_name) or rx.match(table_name)) is not None
+
+
+def _is_selected(qualified_name: str, table_name: str, include_patterns: Tuple[str, ...],
+                 exclude_patterns: Tuple[str, ...], include_all: bool) -> bool:
+    """Decide whether a table is selected by the include/exclude patterns."""
+    if not (include_all or _matches_any(qualified_name, table_name, include_patterns)):
+        return False
+    return not _matches_any(qualified_name, table_name, exclude_patterns)
+
+
+# PostgreSQL data types (lowercase) to RisingWave types
+_PG_TYPE_MAP: Mapping[str, str] = MappingProxyType({
+    # Integer types
+    'smallint': 'SMALLINT',
+    'integer': 'INT',
+    'int': 'INT',
+    'int4': 'INT',
+    'bigint': 'BIGINT',
+    'int8': 'BIGINT',
+
+    # Numeric types
+    'decimal': 'DECIMAL',
+    'numeric': 'DECIMAL',
+    'real': 'REAL',
+    'float4': 'REAL',
+    'double precision': 'DOUBLE',
+    'float8': 'DOUBLE',
+
+    # Character types
+    'character varying': 'VARCHAR',
+    'varchar': 'VARCHAR',
+    'character': 'VARCHAR',
+    'char': 'VARCHAR',
+    'text': 'VARCHAR',
+
+    # Boolean
+    'boolean': 'BOOLEAN',
+    'bool': 'BOOLEAN',
+
+    # Date/Time types
+    'timestamp': 'TIMESTAMP',
+    'timestamp without time zone': 'TIMESTAMP',
+    'timestamp with time zone': 'TIMESTAMPTZ',
+    'timestamptz': 'TIMESTAMPTZ',
+    'date': 'DATE',
+    'time': 'TIME',
+    'time without time zone': 'TIME',
+
+    # JSON types
+    'json': 'JSONB',
+    'jsonb': 'JSONB',
+
+    # Array types (simplified)
+    'array': 'VARCHAR',  # Arrays often need special handling
+
+    # UUID
+    'uuid': 'VARCHAR',
+
+    # Binary types
+    'bytea': 'BYTEA',
+})
 
 
 def map_postgres_type_to_risingwave(postgres_type: str) -> str:
@@ -152,80 +236,28 @@ def map_postgres_type_to_risingwave(postgres_type: str) -> str:
     # Convert to lowercase for consistent mapping
     pg_type = postgres_type.lower()
 
-    # Handle common PostgreSQL types
-    type_mapping = {
-        # Integer types
-        'smallint': 'SMALLINT',
-        'integer': 'INT',
-        'int': 'INT',
-        'int4': 'INT',
-        'bigint': 'BIGINT',
-        'int8': 'BIGINT',
-
-        # Numeric types
-        'decimal': 'DECIMAL',
-        'numeric': 'DECIMAL',
-        'real': 'REAL',
-        'float4': 'REAL',
-        'double precision': 'DOUBLE',
-        'float8': 'DOUBLE',
-
-        # Character types
-        'character varying': 'VARCHAR',
-        'varchar': 'VARCHAR',
-        'character': 'VARCHAR',
-        'char': 'VARCHAR',
-        'text': 'VARCHAR',
-
-        # Boolean
-        'boolean': 'BOOLEAN',
-        'bool': 'BOOLEAN',
-
-        # Date/Time types
-        'timestamp': 'TIMESTAMP',
-        'timestamp without time zone': 'TIMESTAMP',
-        'timestamp with time zone': 'TIMESTAMPTZ',
-        'timestamptz': 'TIMESTAMPTZ',
-        'date': 'DATE',
-        'time': 'TIME',
-        'time without time zone': 'TIME',
-
-        # JSON types
-        'json': 'JSONB',
-        'jsonb': 'JSONB',
-
-        # Array types (simplified)
-        'array': 'VARCHAR',  # Arrays often need special handling
-
-        # UUID
-        'uuid': 'VARCHAR',
-
-        # Binary types
-        'bytea': 'BYTEA',
-    }
-
     # Check for array types (ends with [])
     if pg_type.endswith('[]'):
         base_type = pg_type[:-2]
-        if base_type in type_mapping:
-            return f"{type_mapping[base_type]}[]"
+        if base_type in _PG_TYPE_MAP:
+            return f"{_PG_TYPE_MAP[base_type]}[]"
         return 'VARCHAR[]'  # Default for unknown array types
 
     # Check for types with parameters (e.g., VARCHAR(255))
     if '(' in pg_type:
         base_type = pg_type.split('(')[0]
-        if base_type in type_mapping:
+        if base_type in _PG_TYPE_MAP:
             # For types like VARCHAR(255), keep the parameter
             if base_type in ['character varying', 'varchar', 'character', 'char']:
                 return postgres_type.upper()  # Keep original formatting for VARCHAR(n)
             elif base_type in ['decimal', 'numeric']:
                 return postgres_type.upper()  # Keep precision/scale for DECIMAL(p,s)
             else:
-                return type_mapping[base_type]
+                return _PG_TYPE_MAP[base_type]
 
     # Direct mapping
-    if pg_type in type_mapping:
-        return type_mapping[pg_type]
+    if pg_type in _PG_TYPE_MAP:
+        return _PG_TYPE_MAP[pg_type]
 
     # Default fallback
     return 'VARCHAR'  # Safe default for unknown types
@@ -289,6 +321,19 @@ class SourceConfig(BaseModel):
     backfill_parallelism: Optional[str] = None
     backfill_as_even_splits: bool = True
 
+    def connection_key(self) -> Tuple[str, str, int, str, str, str]:
+        """Hashable key identifying the upstream database and login.
+
+        Used to key discovery caches. Configs are mutable pydantic models
+        and not hashable themselves, and fields such as source_name do not
+        affect what discovery returns, so they are left out. The password
+        is included as a digest, so a config with different credentials
+        never reuses results fetched with another login.
+        """
+        password_digest = hashlib.sha256(self.password.encode()).hexdigest()
+        return (type(self).__name__, self.hostname, self.port, self.username,
+                self.database, password_digest)
+
 
 class SourceConnection(ABC):
     """Abstract base class for source connections."""
@@ -307,14 +352,12 @@ class SourceConnection(ABC):
         # Avoid including hostname to prevent exposure of private information
 
         # Sanitize database name (replace special chars with underscores)
-        clean_db = self.config.database.replace(
-            '-', '_').replace('.', '_').replace(' ', '_')
+        clean_db = self.config.database.translate(_NAME_TRANSLATE)
         base_name = f"postgres_cdc_{clean_db}"
 
         # Add schema if it's not the default 'public'
-        if hasattr(self.config, 'schema_name') and self.config.schema_name != 'public':
-            clean_schema = self.config.schema_name.replace(
-                '-', '_').replace('.', '_').replace(' ', '_')
+        if 'schema_name' in type(self.config).model_fields and self.config.schema_name != 'public':
+            clean_schema = self.config.schema_name.translate(_NAME_TRANSLATE)
             base_name += f"_{clean_schema}"
 
         return base_name
@@ -6,6 +6,20 @@ from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
 
+def _quote_literal(value: str) -> str:
+    """Quote SQL string values."""
+    # str.replace hands back the original string when there is no quote
+    # to escape, so the common case allocates nothing
+    return value.replace("'", "''")
+
+
+def _format_properties(properties: Dict[str, Any]) -> List[str]:
+    """Render extra WITH properties as quoted key='value' items."""
+    # Most values are already strings; only convert the rest
+    return [f"{key}='{_quote_literal(value if isinstance(value, str) else str(value))}'"
+            for key, value in properties.items()]
+
+
 class SinkConfig(BaseModel):
     """Base configuration for sinks."""
 
@@ -19,6 +33,14 @@ class SinkConfig(BaseModel):
     class Config:
         extra = "forbid"
 
+    @property
+    def qualified_sink_name(self) -> Optional[str]:
+        """Sink name qualified with its schema unless it is the default 'public'."""
+        # Not cached: sink_name is filled in by SinkPipeline after construction
+        if self.schema_name == "public":
+            return self.sink_name
+        return f"{self.schema_name}.{self.sink_name}"
+
     def requires_sink_decouple_false(self) -> bool:
         """
         Check if this sink type requires 'SET sink_decouple = false;' before creation.
@@ -57,18 +79,20 @@ class SinkPipeline(ABC):
         # Use sink type and target info to create a practical sink name
         base_name = f"{self.config.sink_type}_sink"
 
-        # Add additional context based on sink type if available
-        if hasattr(self.config, 'database_name') and self.config.database_name:
+        # Add additional context based on sink type if available; check the
+        # declared fields once instead of probing attributes with hasattr
+        fields = type(self.config).model_fields
+        if 'database_name' in fields and self.config.database_name:
             # For Iceberg and similar sinks with database_name
             db_clean = self.config.database_name.replace(
                 '-', '_').replace('.', '_').replace(' ', '_')
             base_name = f"{self.config.sink_type}_{db_clean}_sink"
-        elif hasattr(self.config, 'database') and self.config.database:
+        elif 'database' in fields and self.config.database:
             # For PostgreSQL sinks with database field
             db_clean = self.config.database.replace(
                 '-', '_').replace('.', '_').replace(' ', '_')
             base_name = f"{self.config.sink_type}_{db_clean}_sink"
-        elif hasattr(self.config, 'bucket_name') and self.config.bucket_name:
+        elif 'bucket_name' in fields and self.config.bucket_name:
             # For S3 sinks with bucket name
             bucket_clean = self.config.bucket_name.replace(
                 '-', '_').replace('.', '_')
@@ -89,6 +113,39 @@ class SinkPipeline(ABC):
         """
         pass
 
+    def _build_sink_sql(
+        self,
+        source_table: str,
+        select_query: Optional[str],
+        with_props: List[str],
+        suffix: str = ""
+    ) -> str:
+        """Assemble a CREATE SINK statement around connector-specific parts.
+
+        Args:
+            source_table: Name of source table to sink from
+            select_query: Optional custom SELECT query used instead of the table
+            with_props: Rendered key='value' WITH properties
+            suffix: Text between the WITH clause and the final semicolon,
+                such as a FORMAT ... ENCODE ... clause
+
+        Returns:
+            SQL CREATE SINK statement
+        """
+        # Build the FROM clause or AS clause
+        if select_query:
+            source_clause = f"AS {select_query}"
+        else:
+            source_clause = f"FROM {source_table}"
+
+        with_clause = ",\n    ".join(with_props)
+
+        return f"""CREATE SINK IF NOT EXISTS {self.config.qualified_sink_name}
+{source_clause}
+WITH (
+    {with_clause}
+){suffix};"""
+
     @abstractmethod
     def validate_config(self) -> bool:
         """Validate sink configuration.
@@ -101,6 +158,9 @@ class SinkPipeline(ABC):
         """
         pass
 
+    # Quote SQL string values
+    _quote = staticmethod(_quote_literal)
+
     def get_sink_info(self) -> Dict[str, Any]:
         """Get information about this sink.
 
@@ -1,14 +1,95 @@
 """Iceberg sink implementation for RisingWave."""
 
 from __future__ import annotations
+import functools
 import logging
-from typing import Optional, Dict, Any, Literal
-from pydantic import Field, field_validator, model_validator
+from typing import Optional, Dict, Any, Literal, Tuple
+from pydantic import Field, model_validator
 
-from .base import SinkConfig, SinkPipeline, SinkResult
+from .base import SinkConfig, SinkPipeline, SinkResult, _format_properties, _quote_literal
 
 logger = logging.getLogger(__name__)
 
+# Object storage backends, identified by warehouse_path prefix
+_S3, _GCS, _AZBLOB, _S3_TABLES = "s3", "gcs", "azblob", "s3tables"
+_STORAGE_PREFIXES = (
+    ("s3://", _S3),
+    ("s3a://", _S3),
+    ("gs://", _GCS),
+    ("azblob://", _AZBLOB),
+    ("abfss://", _AZBLOB),
+    ("arn:aws:s3tables:", _S3_TABLES),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _storage_backend(warehouse_path: str) -> Optional[str]:
+    """Classify a warehouse path by its storage backend, or None if unknown."""
+    path = warehouse_path.lower()
+    for prefix, backend in _STORAGE_PREFIXES:
+        if path.startswith(prefix):
+            return backend
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _required_props(data_type: str, warehouse_path: str, database_name: str,
+                    table_name: str, catalog_type: str) -> Tuple[str, ...]:
+    """Build the mandatory WITH properties of an Iceberg sink.
+
+    Sinks created for several source tables share these, so they are
+    formatted once per distinct target instead of on every statement.
+    """
+    return (
+        "connector='iceberg'",
+        f"type='{data_type}'",
+        f"warehouse.path='{_quote_literal(warehouse_path)}'",
+        f"database.name='{_quote_literal(database_name)}'",
+        f"table.name='{_quote_literal(table_name)}'",
+        f"catalog.type='{catalog_type}'",
+    )
+
+
+# How an optional IcebergConfig field is rendered into the WITH clause:
+# quoted string when set, 'true'/'false' when not None, or 'true' when enabled
+_STR, _BOOL, _FLAG = "str", "bool", "flag"
+
+# SQL spelling of boolean property values
+_BOOL_STR = {True: "true", False: "false"}
+
+# Optional WITH properties as (config attribute, property key, kind), in the
+# order they appear in the generated SQL
+_OPTIONAL_PROPS = (
+    # Catalog-specific properties
+    ("catalog_name", "catalog.name", _STR),
+    ("catalog_uri", "catalog.uri", _STR),
+    ("catalog_credential", "catalog.credential", _STR),
+    ("catalog_jdbc_user", "catalog.jdbc.user", _STR),
+    ("catalog_jdbc_password", "catalog.jdbc.password", _STR),
+    # REST catalog specific properties
+    ("catalog_rest_signing_region", "catalog.rest.signing_region", _STR),
+    ("catalog_rest_signing_name", "catalog.rest.signing_name", _STR),
+    ("catalog_rest_sigv4_enabled", "catalog.rest.sigv4_enabled", _BOOL),
+    # Sink mode
+    ("primary_key", "primary_key", _STR),
+    ("force_append_only", "force_append_only", _FLAG),
+    # S3-compatible storage properties
+    ("s3_region", "s3.region", _STR),
+    ("s3_endpoint", "s3.endpoint", _STR),
+    ("s3_access_key", "s3.access.key", _STR),
+    ("s3_secret_key", "s3.secret.key", _STR),
+    ("s3_path_style_access", "s3.path.style.access", _BOOL),
+    ("enable_config_load", "enable_config_load", _BOOL),
+    # Google Cloud Storage properties
+    ("gcs_credential", "gcs.credential", _STR),
+    # Azure Blob Storage properties
+    ("azblob_account_name", "azblob.account_name", _STR),
+    ("azblob_account_key", "azblob.account_key", _STR),
+    ("azblob_endpoint_url", "azblob.endpoint_url", _STR),
+    # Delivery guarantees
+    ("is_exactly_once", "is_exactly_once", _FLAG),
+)
+
 
 class IcebergConfig(SinkConfig):
     """Configuration for Iceberg sink."""
@@ -112,59 +193,38 @@ class IcebergConfig(SinkConfig):
     )
 
     @model_validator(mode='after')
-    def validate_upsert_requirements(self):
-        """Validate upsert requirements."""
+    def validate_sink_config(self):
+        """Validate cross-field requirements in a single pass."""
+        # Validate upsert requirements
         if self.data_type == 'upsert' and not self.primary_key:
             raise ValueError("primary_key is required for upsert sinks")
-        return self
 
-    @model_validator(mode='after')
-    def validate_catalog_requirements(self):
-        """Validate catalog-specific requirements."""
+        # Validate catalog-specific requirements
         if self.catalog_type == 'glue' and not self.catalog_name:
             raise ValueError("catalog_name is required for glue catalog")
         if self.catalog_type in ['rest', 'jdbc'] and not self.catalog_uri:
             raise ValueError(
                 f"catalog_uri is required for {self.catalog_type} catalog")
-        return self
 
-    @field_validator('commit_checkpoint_interval')
-    @classmethod
-    def validate_commit_interval(cls, v):
-        """Validate commit checkpoint interval."""
-        if v <= 0:
+        # Validate commit and compaction settings
+        if self.commit_checkpoint_interval <= 0:
             raise ValueError("commit_checkpoint_interval must be positive")
-        return v
-
-    @field_validator('commit_retry_num')
-    @classmethod
-    def validate_commit_retry(cls, v):
-        """Validate commit retry number."""
-        if v < 0:
+        if self.commit_retry_num < 0:
             raise ValueError("commit_retry_num must be non-negative")
-        return v
-
-    @field_validator('compaction_interval_sec')
-    @classmethod
-    def validate_compaction_interval(cls, v):
-        """Validate compaction interval."""
-        if v <= 0:
+        if self.compaction_interval_sec <= 0:
             raise ValueError("compaction_interval_sec must be positive")
-        return v
 
-    @model_validator(mode='after')
-    def validate_object_storage_config(self):
-        """Validate object storage configurations."""
-        warehouse_path = self.warehouse_path.lower() if self.warehouse_path else ''
+        # Validate object storage configurations
+        backend = _storage_backend(self.warehouse_path)
 
         # Validate S3 configuration
-        if warehouse_path.startswith('s3://') or warehouse_path.startswith('s3a://'):
+        if backend == _S3:
             if not self.s3_region and not self.s3_endpoint:
                 raise ValueError(
                     "Either s3.region or s3.endpoint must be specified for S3 storage")
 
         # Validate Azure Blob Storage configuration
-        elif warehouse_path.startswith('azblob://') or warehouse_path.startswith('abfss://'):
+        elif backend == _AZBLOB:
             if not self.azblob_account_name:
                 raise ValueError(
                     "azblob.account_name is required for Azure Blob Storage")
@@ -173,7 +233,7 @@ class IcebergConfig(SinkConfig):
                     "azblob.account_key is required for Azure Blob Storage")
 
         # Validate S3 Tables configuration
-        elif warehouse_path.startswith('arn:aws:s3tables:'):
+        elif backend == _S3_TABLES:
             if self.catalog_type != 'rest':
                 raise ValueError(
                     "catalog.type must be 'rest' for Amazon S3 Tables")
@@ -208,12 +268,11 @@ class IcebergSink(SinkPipeline):
         if not self.config.catalog_type:
             raise ValueError("catalog_type is required for Iceberg sink")
 
-        # Validate catalog-specific requirements
-        if self.config.catalog_type == 'glue' and not self.config.catalog_name:
-            raise ValueError("catalog_name is required for glue catalog")
-        if self.config.catalog_type in ['rest', 'jdbc'] and not self.config.catalog_uri:
-            raise ValueError(
-                f"catalog_uri is required for {self.config.catalog_type} catalog")
+        # Re-check the cross-field rules IcebergConfig enforces on
+        # construction, in case the config was modified afterwards
+        self.config.validate_sink_config()
+
+        # JDBC credentials are only checked when the sink is created
         if self.config.catalog_type == 'jdbc':
             if not self.config.catalog_jdbc_user:
                 raise ValueError(
@@ -222,45 +281,18 @@ class IcebergSink(SinkPipeline):
                 raise ValueError(
                     "catalog_jdbc_password is required for jdbc catalog")
 
-        # Validate upsert requirements
-        if self.config.data_type == 'upsert' and not self.config.primary_key:
-            raise ValueError("primary_key is required for upsert sinks")
-
-        # Validate storage backend configuration
-        warehouse_path = self.config.warehouse_path.lower()
-        if warehouse_path.startswith('s3://') or warehouse_path.startswith('s3a://'):
-            # S3-compatible storage validation
-            if not self.config.s3_region and not self.config.s3_endpoint:
-                raise ValueError(
-                    "Either s3.region or s3.endpoint must be specified for S3 storage")
+        # Warn about storage credentials that may come from the environment
+        backend = _storage_backend(self.config.warehouse_path)
+        if backend == _S3:
             # Access keys are optional if using IAM roles or enable_config_load
             if not self.config.enable_config_load and not (self.config.s3_access_key and self.config.s3_secret_key):
                 logger.warning(
                     "S3 access credentials not provided. Ensure IAM roles are configured or enable_config_load is true.")
-        elif warehouse_path.startswith('gs://'):
+        elif backend == _GCS:
             # Google Cloud Storage validation
             if not self.config.gcs_credential:
                 logger.warning(
                     "GCS credential not provided. Ensure ADC (Application Default Credentials) are configured.")
-        elif warehouse_path.startswith('azblob://') or warehouse_path.startswith('abfss://'):
-            # Azure Blob Storage validation
-            if not self.config.azblob_account_name or not self.config.azblob_account_key:
-                raise ValueError(
-                    "azblob.account_name and azblob.account_key are required for Azure Blob Storage")
-        elif warehouse_path.startswith('arn:aws:s3tables:'):
-            # Amazon S3 Tables validation
-            if self.config.catalog_type != 'rest':
-                raise ValueError(
-                    "catalog.type must be 'rest' for Amazon S3 Tables")
-            if not self.config.catalog_rest_signing_region:
-                raise ValueError(
-                    "catalog.rest.signing_region is required for S3 Tables")
-            if not self.config.catalog_rest_signing_name:
-                raise ValueError(
-                    "catalog.rest.signing_name is required for S3 Tables")
-            if not self.config.catalog_rest_sigv4_enabled:
-                raise ValueError(
-                    "catalog.rest.sigv4_enabled must be true for S3 Tables")
 
         return True
 
@@ -276,138 +308,53 @@ class IcebergSink(SinkPipeline):
         """
         self.validate_config()
 
-        # Build the FROM clause or AS clause
-        if select_query:
-            source_clause = f"AS {select_query}"
-        else:
-            source_clause = f"FROM {source_table}"
-
-        # Build WITH properties
-        with_props = [
-            "connector='iceberg'",
-            f"type='{self.config.data_type}'",
-            f"warehouse.path='{self._quote(self.config.warehouse_path)}'",
-            f"database.name='{self._quote(self.config.database_name)}'",
-            f"table.name='{self._quote(self.config.table_name)}'",
-            f"catalog.type='{self.config.catalog_type}'"
-        ]
-
-        # Add catalog-specific properties
-        if self.config.catalog_name:
-            with_props.append(
-                f"catalog.name='{self._quote(self.config.catalog_name)}'")
-        if self.config.catalog_uri:
-            with_props.append(
-                f"catalog.uri='{self._quote(self.config.catalog_uri)}'")
-        if self.config.catalog_credential:
-            with_props.append(
-                f"catalog.credential='{self._quote(self.config.catalog_credential)}'")
-        if self.config.catalog_jdbc_user:
-            with_props.append(
-                f"catalog.jdbc.user='{self._quote(self.config.catalog_jdbc_user)}'")
-        if self.config.catalog_jdbc_password:
-            with_props.append(
-                f"catalog.jdbc.password='{self._quote(self.config.catalog_jdbc_password)}'")
-
-        # Add REST catalog specific properties
-        if self.config.catalog_rest_signing_region:
-            with_props.append(
-                f"catalog.rest.signing_region='{self._quote(self.config.catalog_rest_signing_region)}'")
-        if self.config.catalog_rest_signing_name:
-            with_props.append(
-                f"catalog.rest.signing_name='{self._quote(self.config.catalog_rest_signing_name)}'")
-        if self.config.catalog_rest_sigv4_enabled is not None:
-            with_props.append(
-                f"catalog.rest.sigv4_enabled='{str(self.config.catalog_rest_sigv4_enabled).lower()}'")
-
-        # Add primary key for upsert
-        if self.config.primary_key:
-            with_props.append(
-                f"primary_key='{self._quote(self.config.primary_key)}'")
-
-        # Add force append only
-        if self.config.force_append_only:
-            with_props.append("force_append_only='true'")
-
-        # Add S3-compatible storage properties
-        if self.config.s3_region:
-            with_props.append(
-                f"s3.region='{self._quote(self.config.s3_region)}'")
-        if self.config.s3_endpoint:
-            with_props.append(
-                f"s3.endpoint='{self._quote(self.config.s3_endpoint)}'")
-        if self.config.s3_access_key:
-            with_props.append(
-                f"s3.access.key='{self._quote(self.config.s3_access_key)}'")
-        if self.config.s3_secret_key:
-            with_props.append(
-                f"s3.secret.key='{self._quote(self.config.s3_secret_key)}'")
-        if self.config.s3_path_style_access is not None:
-            with_props.append(
-                f"s3.path.style.access='{str(self.config.s3_path_style_access).lower()}'")
-        if self.config.enable_config_load is not None:
-            with_props.append(
-                f"enable_config_load='{str(self.config.enable_config_load).lower()}'")
-
-        # Add Google Cloud Storage properties
-        if self.config.gcs_credential:
-            with_props.append(
-                f"gcs.credential='{self._quote(self.config.gcs_credential)}'")
-
-        # Add Azure Blob Storage properties
-        if self.config.azblob_account_name:
-            with_props.append(
-                f"azblob.account_name='{self._quote(self.config.azblob_account_name)}'")
-        if self.config.azblob_account_key:
-            with_props.append(
-                f"azblob.account_key='{self._quote(self.config.azblob_account_key)}'")
-        if self.config.azblob_endpoint_url:
-            with_props.append(
-                f"azblob.endpoint_url='{self._quote(self.config.azblob_endpoint_url)}'")
+        # Local aliases for the many property reads below
+        config = self.config
+        quote = self._quote
+
+        # Build WITH properties, starting from the mandatory ones
+        with_props = list(_required_props(
+            config.data_type, config.warehouse_path, config.database_name,
+            config.table_name, config.catalog_type))
+        append = with_props.append
+
+        # Add optional catalog, storage and delivery properties
+        for attr, key, kind in _OPTIONAL_PROPS:
+            value = getattr(config, attr)
+            if kind == _STR:
+                if value:
+                    append(f"{key}='{quote(value)}'")
+            elif kind == _BOOL:
+                if value is not None:
+                    append(f"{key}='{_BOOL_STR[value]}'")
+            elif value:
+                append(f"{key}='true'")
 
         # Add advanced features
-        if self.config.is_exactly_once:
-            with_props.append("is_exactly_once='true'")
-        if self.config.commit_checkpoint_interval != 60:  # Only add if not default
-            with_props.append(
-                f"commit_checkpoint_interval={self.config.commit_checkpoint_interval}")
-        if self.config.commit_retry_num != 8:  # Only add if not default
-            with_props.append(
-                f"commit_retry_num={self.config.commit_retry_num}")
+        if config.commit_checkpoint_interval != 60:  # Only add if not default
+            append(
+                f"commit_checkpoint_interval={config.commit_checkpoint_interval}")
+        if config.commit_retry_num != 8:  # Only add if not default
+            append(
+                f"commit_retry_num={config.commit_retry_num}")
 
         # Add table management
-        if self.config.create_table_if_not_exists:
-            with_props.append("create_table_if_not_exists=true")
+        if config.create_table_if_not_exists:
+            append("create_table_if_not_exists=true")
 
         # Add compaction features
-        if self.config.enable_compaction:
-            with_props.append("enable_compaction=true")
-            if self.config.compaction_interval_sec != 3600:  # Only add if not default
-                with_props.append(
-                    f"compaction_interval_sec={self.config.compaction_interval_sec}")
-        if self.config.enable_snapshot_expiration:
-            with_props.append("enable_snapshot_expiration=true")
+        if config.enable_compaction:
+            append("enable_compaction=true")
+            if config.compaction_interval_sec != 3600:  # Only add if not default
+                append(
+                    f"compaction_interval_sec={config.compaction_interval_sec}")
+        if config.enable_snapshot_expiration:
+            append("enable_snapshot_expiration=true")
 
         # Add extra properties
-        for key, value in self.config.extra_properties.items():
-            with_props.append(f"{key}='{self._quote(str(value))}'")
-
-        with_clause = ",\n    ".join(with_props)
-
-        # Generate full SQL
-        qualified_sink_name = f"{self.config.schema_name}.{self.config.sink_name}" if self.config.schema_name != "public" else self.config.sink_name
-
-        sql = f"""CREATE SINK IF NOT EXISTS {qualified_sink_name}
-{source_clause}
-WITH (
-    {with_clause}
-);"""
-
-        return sql
+        with_props.extend(_format_properties(config.extra_properties))
 
-    def _quote(self, value: str) -> str:
-        """Quote SQL string values."""
-        return value.replace("'", "''")
+        return self._build_sink_sql(source_table, select_query, with_props)
 
     def create_sink(self, source_table: str, select_query: Optional[str] = None) -> SinkResult:
         """Create Iceberg sink and return result.
@@ -419,17 +366,20 @@ WITH (
         Returns:
             SinkResult with creation details
         """
+        # Every field is built here from validated config, so skip
+        # re-validating the result
         try:
             sql = self.create_sink_sql(source_table, select_query)
-            return SinkResult(
+            return SinkResult.model_construct(
                 sink_name=self.config.sink_name,
                 sink_type=self.config.sink_type,
                 sql_statement=sql,
                 source_table=source_table,
-                success=True
+                success=True,
+                error_message=None
             )
         except Exception as e:
-            return SinkResult(
+            return SinkResult.model_construct(
                 sink_name=self.config.sink_name,
                 sink_type=self.config.sink_type,
                 sql_statement="",
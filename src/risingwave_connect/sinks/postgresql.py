@@ -5,7 +5,7 @@ import logging
 from typing import Optional, Dict, Any
 from pydantic import Field, field_validator
 
-from .base import SinkConfig, SinkPipeline, SinkResult
+from .base import SinkConfig, SinkPipeline, SinkResult, _format_properties
 
 logger = logging.getLogger(__name__)
 
@@ -84,52 +84,34 @@ class PostgreSQLSink(SinkPipeline):
         """
         self.validate_config()
 
-        # Build the FROM clause or AS clause
-        if select_query:
-            source_clause = f"AS {select_query}"
-        else:
-            source_clause = f"FROM {source_table}"
+        # Local aliases for the many property reads below
+        config = self.config
+        quote = self._quote
 
         # Determine target table name
-        target_table = self.config.table_name or self.config.sink_name
+        target_table = config.table_name or config.sink_name
 
         # Build WITH properties
         with_props = [
             "connector='postgres'",
-            f"postgres.host='{self._quote(self.config.hostname)}'",
-            f"postgres.port='{self.config.port}'",
-            f"postgres.user='{self._quote(self.config.username)}'",
-            f"postgres.password='{self._quote(self.config.password)}'",
-            f"postgres.database='{self._quote(self.config.database)}'",
-            f"postgres.table='{self._quote(self.config.postgres_schema)}.{self._quote(target_table)}'",
-            f"type='{self.config.data_type}'"
+            f"postgres.host='{quote(config.hostname)}'",
+            f"postgres.port='{config.port}'",
+            f"postgres.user='{quote(config.username)}'",
+            f"postgres.password='{quote(config.password)}'",
+            f"postgres.database='{quote(config.database)}'",
+            f"postgres.table='{quote(config.postgres_schema)}.{quote(target_table)}'",
+            f"type='{config.data_type}'"
         ]
 
         # Add optional SSL mode
-        if self.config.ssl_mode:
+        if config.ssl_mode:
             with_props.append(
-                f"postgres.ssl.mode='{self._quote(self.config.ssl_mode)}'")
+                f"postgres.ssl.mode='{quote(config.ssl_mode)}'")
 
         # Add extra properties
-        for key, value in self.config.extra_properties.items():
-            with_props.append(f"{key}='{self._quote(str(value))}'")
+        with_props.extend(_format_properties(config.extra_properties))
 
-        with_clause = ",\n    ".join(with_props)
-
-        # Generate full SQL
-        qualified_sink_name = f"{self.config.schema_name}.{self.config.sink_name}" if self.config.schema_name != "public" else self.config.sink_name
-
-        sql = f"""CREATE SINK IF NOT EXISTS {qualified_sink_name}
-{source_clause}
-WITH (
-    {with_clause}
-);"""
-
-        return sql
-
-    def _quote(self, value: str) -> str:
-        """Quote SQL string values."""
-        return value.replace("'", "''")
+        return self._build_sink_sql(source_table, select_query, with_props)
 
     def create_sink(self, source_table: str, select_query: Optional[str] = None) -> SinkResult:
         """Create PostgreSQL sink and return result.
@@ -141,17 +123,20 @@ WITH (
         Returns:
             SinkResult with creation details
         """
+        # Every field is built here from validated config, so skip
+        # re-validating the result
         try:
             sql = self.create_sink_sql(source_table, select_query)
-            return SinkResult(
+            return SinkResult.model_construct(
                 sink_name=self.config.sink_name,
                 sink_type=self.config.sink_type,
                 sql_statement=sql,
                 source_table=source_table,
-                success=True
+                success=True,
+                error_message=None
             )
         except Exception as e:
-            return SinkResult(
+            return SinkResult.model_construct(
                 sink_name=self.config.sink_name,
                 sink_type=self.config.sink_type,
                 sql_statement="",
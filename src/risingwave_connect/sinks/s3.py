@@ -3,12 +3,17 @@
 from __future__ import annotations
 import logging
 from typing import Optional, Dict, Any
-from pydantic import Field, field_validator
+from pydantic import Field, model_validator
 
-from .base import SinkConfig, SinkPipeline, SinkResult
+from .base import SinkConfig, SinkPipeline, SinkResult, _format_properties
 
 logger = logging.getLogger(__name__)
 
+# Accepted S3 sink options, in the order shown in validation errors
+_DATA_TYPES = ('append-only',)
+_FORMAT_TYPES = ('PLAIN', 'UPSERT', 'DEBEZIUM')
+_ENCODE_TYPES = ('PARQUET', 'JSON', 'CSV')
+
 
 class S3Config(SinkConfig):
     """Configuration for S3 sink."""
@@ -40,32 +45,19 @@ class S3Config(SinkConfig):
     extra_properties: Dict[str, Any] = Field(
         default_factory=dict, description="Additional WITH properties")
 
-    @field_validator('data_type')
-    @classmethod
-    def validate_data_type(cls, v):
-        """Validate data type."""
-        allowed = ['append-only']
-        if v not in allowed:
-            raise ValueError(f"data_type must be one of {allowed}, got {v}")
-        return v
-
-    @field_validator('format_type')
-    @classmethod
-    def validate_format_type(cls, v):
-        """Validate format type."""
-        allowed = ['PLAIN', 'UPSERT', 'DEBEZIUM']
-        if v not in allowed:
-            raise ValueError(f"format_type must be one of {allowed}, got {v}")
-        return v
-
-    @field_validator('encode_type')
-    @classmethod
-    def validate_encode_type(cls, v):
-        """Validate encode type."""
-        allowed = ['PARQUET', 'JSON', 'CSV']
-        if v not in allowed:
-            raise ValueError(f"encode_type must be one of {allowed}, got {v}")
-        return v
+    @model_validator(mode='after')
+    def validate_sink_options(self):
+        """Validate data, format and encode types."""
+        if self.data_type not in _DATA_TYPES:
+            raise ValueError(
+                f"data_type must be one of {list(_DATA_TYPES)}, got {self.data_type}")
+        if self.format_type not in _FORMAT_TYPES:
+            raise ValueError(
+                f"format_type must be one of {list(_FORMAT_TYPES)}, got {self.format_type}")
+        if self.encode_type not in _ENCODE_TYPES:
+            raise ValueError(
+                f"encode_type must be one of {list(_ENCODE_TYPES)}, got {self.encode_type}")
+        return self
 
 
 class S3Sink(SinkPipeline):
@@ -97,44 +89,39 @@ class S3Sink(SinkPipeline):
         """
         self.validate_config()
 
-        # Build the FROM clause or AS clause
-        if select_query:
-            source_clause = f"AS {select_query}"
-        else:
-            source_clause = f"FROM {source_table}"
+        # Local aliases for the many property reads below
+        config = self.config
+        quote = self._quote
 
         # Build WITH properties
         with_props = [
             "connector='s3'",
-            f"s3.region_name='{self._quote(self.config.region_name)}'",
-            f"s3.bucket_name='{self._quote(self.config.bucket_name)}'",
-            f"s3.path='{self._quote(self.config.path)}'",
-            f"type='{self.config.data_type}'"
+            f"s3.region_name='{quote(config.region_name)}'",
+            f"s3.bucket_name='{quote(config.bucket_name)}'",
+            f"s3.path='{quote(config.path)}'",
+            f"type='{config.data_type}'"
         ]
 
         # Add optional credentials
-        if self.config.access_key_id:
+        if config.access_key_id:
             with_props.append(
-                f"s3.credentials.access='{self._quote(self.config.access_key_id)}'")
-        if self.config.secret_access_key:
+                f"s3.credentials.access='{quote(config.access_key_id)}'")
+        if config.secret_access_key:
             with_props.append(
-                f"s3.credentials.secret='{self._quote(self.config.secret_access_key)}'")
-        if self.config.endpoint_url:
+                f"s3.credentials.secret='{quote(config.secret_access_key)}'")
+        if config.endpoint_url:
             with_props.append(
-                f"s3.endpoint_url='{self._quote(self.config.endpoint_url)}'")
-        if self.config.assume_role:
+                f"s3.endpoint_url='{quote(config.endpoint_url)}'")
+        if config.assume_role:
             with_props.append(
-                f"s3.assume_role='{self._quote(self.config.assume_role)}'")
+                f"s3.assume_role='{quote(config.assume_role)}'")
 
         # Add extra properties
-        for key, value in self.config.extra_properties.items():
-            with_props.append(f"{key}='{self._quote(str(value))}'")
-
-        with_clause = ",\n    ".join(with_props)
+        with_props.extend(_format_properties(config.extra_properties))
 
         # Build encode clause
         encode_props = []
-        if self.config.encode_type == "PARQUET" and self.config.force_append_only:
+        if config.encode_type == "PARQUET" and config.force_append_only:
             encode_props.append("force_append_only=true")
 
         encode_clause = ""
@@ -142,21 +129,9 @@ class S3Sink(SinkPipeline):
             encode_params = ", ".join(encode_props)
             encode_clause = f"({encode_params})"
 
-        # Generate full SQL
-        qualified_sink_name = f"{self.config.schema_name}.{self.config.sink_name}" if self.config.schema_name != "public" else self.config.sink_name
-
-        sql = f"""CREATE SINK IF NOT EXISTS {qualified_sink_name}
-{source_clause}
-WITH (
-    {with_clause}
-)
-FORMAT {self.config.format_type} ENCODE {self.config.encode_type}{encode_clause};"""
-
-        return sql
-
-    def _quote(self, value: str) -> str:
-        """Quote SQL string values."""
-        return value.replace("'", "''")
+        return self._build_sink_sql(
+            source_table, select_query, with_props,
+            f"\nFORMAT {config.format_type} ENCODE {config.encode_type}{encode_clause}")
 
     def create_sink(self, source_table: str, select_query: Optional[str] = None) -> SinkResult:
         """Create S3 sink and return result.
@@ -168,17 +143,20 @@ FORMAT {self.config.format_type} ENCODE {self.config.encode_type}{encode_clause}
         Returns:
             SinkResult with creation details
         """
+        # Every field is built here from validated config, so skip
+        # re-validating the result
         try:
             sql = self.create_sink_sql(source_table, select_query)
-            return SinkResult(
+            return SinkResult.model_construct(
                 sink_name=self.config.sink_name,
                 sink_type=self.config.sink_type,
                 sql_statement=sql,
                 source_table=source_table,
-                success=True
+                success=True,
+                error_message=None
             )
         except Exception as e:
-            return SinkResult(
+            return SinkResult.model_construct(
                 sink_name=self.config.sink_name,
                 sink_type=self.config.sink_type,
                 sql_statement="",
@@ -15,7 +15,8 @@ from ..discovery.base import (
     SourceConfig,
     TableInfo,
     ColumnInfo,
-    ColumnSelection
+    ColumnSelection,
+    _NAME_TRANSLATE
 )
 
 logger = logging.getLogger(__name__)
@@ -336,8 +337,7 @@ class MongoDBSourceConnection(SourceConnection):
         """Generate a default source name for MongoDB."""
         db_names = self.config.get_database_names()
         if db_names:
-            clean_db = db_names[0].replace(
-                '-', '_').replace('.', '_').replace(' ', '_')
+            clean_db = db_names[0].translate(_NAME_TRANSLATE)
             base_name = f"mongodb_cdc_{clean_db}"
             if len(db_names) > 1:
                 base_name += "_multi"
@@ -1,8 +1,11 @@
 """PostgreSQL-specific discovery and pipeline implementation."""
 
 from __future__ import annotations
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Union
+import re
+import sys
+from typing import Dict, Iterator, List, Optional, Any, Union
 from contextlib import contextmanager
 
 import psycopg
@@ -19,6 +22,14 @@ from ..discovery.base import (
 
 logger = logging.getLogger(__name__)
 
+# SSL modes accepted by the RisingWave postgres-cdc connector
+_SSL_MODES = ('disabled', 'preferred', 'required', 'verify-ca', 'verify-full')
+
+# PostgreSQL only allows lower case letters, digits and underscores in
+# replication slot names, up to NAMEDATALEN - 1 characters. Publication
+# names are held to the same rule, which also keeps them safe to quote.
+_SLOT_NAME_RE = re.compile(r'[a-z0-9_]{1,63}')
+
 
 class PostgreSQLConfig(SourceConfig):
     """PostgreSQL-specific configuration.
@@ -49,11 +60,21 @@ class PostgreSQLConfig(SourceConfig):
         """Validate SSL mode values."""
         if v is None:
             return v
-        valid_modes = ['disabled', 'preferred',
-                       'required', 'verify-ca', 'verify-full']
-        if v not in valid_modes:
+        if v not in _SSL_MODES:
             raise ValueError(
-                f"ssl_mode must be one of: {', '.join(valid_modes)}")
+                f"ssl_mode must be one of: {', '.join(_SSL_MODES)}")
+        return v
+
+    @field_validator('slot_name', 'publication_name')
+    @classmethod
+    def validate_cdc_names(cls, v, info):
+        """Reject slot and publication names PostgreSQL would refuse to create."""
+        if v is None:
+            return v
+        if not _SLOT_NAME_RE.fullmatch(v):
+            raise ValueError(
+                f"{info.field_name} may only contain lower case letters, numbers "
+                "and underscores, and must be at most 63 characters")
         return v
 
     @field_validator('backfill_num_rows_per_split', 'backfill_parallelism')
@@ -96,6 +117,23 @@ class PostgreSQLDiscovery(DatabaseDiscovery):
     def __init__(self, config: PostgreSQLConfig):
         self.config = config
         self._dsn = self._build_dsn()
+        self._conn: Optional[psycopg.Connection] = None
+
+    def __enter__(self) -> "PostgreSQLDiscovery":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the cached PostgreSQL connection, if any."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing PostgreSQL connection: {e}")
+            finally:
+                self._conn = None
 
     def _build_dsn(self) -> str:
         """Build PostgreSQL connection string with SSL support."""
@@ -124,9 +162,22 @@ class PostgreSQLDiscovery(DatabaseDiscovery):
 
     @contextmanager
     def _connection(self):
-        """Get database connection."""
-        with psycopg.connect(self._dsn) as conn:
-            yield conn
+        """Get database connection.
+
+        The connection is opened on first use and reused by later calls, so
+        discovery, existence checks and column lookups share one handshake.
+        A closed or broken connection is replaced on the next call.
+        """
+        if self._conn is None or self._conn.closed:
+            # Discovery only reads metadata; autocommit avoids leaving the
+            # cached connection idle in a transaction between calls
+            self._conn = psycopg.connect(self._dsn, autocommit=True)
+        try:
+            yield self._conn
+        except psycopg.Error:
+            if self._conn.broken:
+                self.close()
+            raise
 
     def test_connection(self) -> bool:
         """Test database connection."""
@@ -153,6 +204,15 @@ class PostgreSQLDiscovery(DatabaseDiscovery):
 
     def list_tables(self, schema_name: Optional[str] = None) -> List[TableInfo]:
         """List tables in specified schema or all schemas."""
+        return list(self.iter_tables(schema_name))
+
+    def iter_tables(self, schema_name: Optional[str] = None) -> Iterator[TableInfo]:
+        """Yield tables in specified schema or all schemas as rows arrive.
+
+        Unlike list_tables(), no intermediate list is built, so callers that
+        filter the result (e.g. TableSelector.select_stream) only keep the
+        tables they select.
+        """
         with self._connection() as conn:
             with conn.cursor() as cur:
                 if schema_name:
@@ -190,17 +250,17 @@ class PostgreSQLDiscovery(DatabaseDiscovery):
                         ORDER BY t.table_schema, t.table_name
                     """)
 
-                tables = []
-                for row in cur.fetchall():
-                    tables.append(TableInfo(
-                        schema_name=row[0],
+                for row in cur:
+                    # Schema and type repeat on every row; intern them so all
+                    # TableInfo objects share one string each
+                    yield TableInfo(
+                        schema_name=sys.intern(row[0]),
                         table_name=row[1],
-                        table_type=row[2],
+                        table_type=sys.intern(row[2]),
                         row_count=row[3] if row[3] is not None else 0,
                         size_bytes=row[4] if row[4] is not None else 0,
                         comment=row[5]
-                    ))
-                return tables
+                    )
 
     def check_specific_tables(self, table_names: List[str], schema_name: Optional[str] = None) -> List[TableInfo]:
         """Check if specific tables exist and return their info.
@@ -412,63 +472,108 @@ class PostgreSQLDiscovery(DatabaseDiscovery):
         return validation_result
 
 
+@functools.lru_cache(maxsize=64)
+def _table_with_clause(
+    backfill_num_rows_per_split: Optional[str],
+    backfill_parallelism: Optional[str],
+    backfill_as_even_splits: Optional[bool],
+    snapshot: Optional[bool]
+) -> str:
+    """Build the WITH clause for CREATE TABLE ... FROM source.
+
+    Tables in one connection almost always share these settings, so the
+    clause is built once and reused for every table.
+    """
+    with_items = []
+    if backfill_num_rows_per_split is not None:
+        with_items.append(
+            f"backfill.num_rows_per_split='{backfill_num_rows_per_split}'")
+    if backfill_parallelism is not None:
+        with_items.append(f"backfill.parallelism='{backfill_parallelism}'")
+    if backfill_as_even_splits is not None:
+        with_items.append(
+            f"backfill.as_even_splits='{str(backfill_as_even_splits).lower()}'")
+
+    # Add snapshot parameter if provided
+    if snapshot is not None:
+        with_items.append(f"snapshot='{str(snapshot).lower()}'")
+
+    if not with_items:
+        return ""
+    joined_items = ',\n    '.join(with_items)
+    return f"\nWITH (\n    {joined_items}\n)"
+
+
 class PostgreSQLSourceConnection(SourceConnection):
     """PostgreSQL CDC source connection implementation."""
 
-    def __init__(self, rw_client, config: PostgreSQLConfig):
+    def __init__(self, rw_client, config: PostgreSQLConfig,
+                 discovery: Optional[PostgreSQLDiscovery] = None):
         super().__init__(rw_client, config)
         self.config: PostgreSQLConfig = config
+        self._discovery: Optional[PostgreSQLDiscovery] = discovery
+
+    @property
+    def discovery(self) -> PostgreSQLDiscovery:
+        """Discovery used to validate column selections, created on first use."""
+        if self._discovery is None:
+            self._discovery = PostgreSQLDiscovery(self.config)
+        return self._discovery
 
     def create_source_sql(self) -> str:
         """Generate CREATE SOURCE SQL for PostgreSQL CDC."""
+        # Local aliases; the config and escaper are read a dozen times below
+        config = self.config
+        escape = self._escape_sql_string
+
         with_items = [
             "connector='postgres-cdc'",
-            f"hostname='{self._escape_sql_string(self.config.hostname)}'",
-            f"port='{self.config.port}'",
-            f"username='{self._escape_sql_string(self.config.username)}'",
-            f"password='{self._escape_sql_string(self.config.password)}'",
-            f"database.name='{self._escape_sql_string(self.config.database)}'",
-            f"schema.name='{self._escape_sql_string(self.config.schema_name)}'",
+            f"hostname='{escape(config.hostname)}'",
+            f"port='{config.port}'",
+            f"username='{escape(config.username)}'",
+            f"password='{escape(config.password)}'",
+            f"database.name='{escape(config.database)}'",
+            f"schema.name='{escape(config.schema_name)}'",
             # Always include ssl_mode since it's required
-            f"ssl.mode='{self.config.ssl_mode}'",
+            f"ssl.mode='{config.ssl_mode}'",
         ]
 
         # Add optional configurations
-        if self.config.ssl_root_cert:
+        if config.ssl_root_cert:
             with_items.append(
-                f"ssl.root.cert='{self._escape_sql_string(self.config.ssl_root_cert)}'")
-        if self.config.slot_name:
+                f"ssl.root.cert='{escape(config.ssl_root_cert)}'")
+        if config.slot_name:
             with_items.append(
-                f"slot.name='{self._escape_sql_string(self.config.slot_name)}'")
+                f"slot.name='{escape(config.slot_name)}'")
 
         # Add publication settings only if explicitly provided by user
-        if self.config.publication_name is not None:
+        if config.publication_name is not None:
             with_items.append(
-                f"publication.name='{self._escape_sql_string(self.config.publication_name)}'")
-        if self.config.publication_create_enable is not None:
+                f"publication.name='{escape(config.publication_name)}'")
+        if config.publication_create_enable is not None:
             with_items.append(
-                f"publication.create.enable='{str(self.config.publication_create_enable).lower()}'")
+                f"publication.create.enable='{str(config.publication_create_enable).lower()}'")
 
-        if self.config.transactional is not None:
+        if config.transactional is not None:
             with_items.append(
-                f"transactional='{str(self.config.transactional).lower()}'")
+                f"transactional='{str(config.transactional).lower()}'")
 
         with_items.append(
-            f"auto.schema.change='{str(self.config.auto_schema_change).lower()}'")
+            f"auto.schema.change='{str(config.auto_schema_change).lower()}'")
 
         # Add Debezium properties
-        for key, value in self.config.debezium_properties.items():
+        for key, value in config.debezium_properties.items():
             with_items.append(
-                f"debezium.{key}='{self._escape_sql_string(str(value))}'")
+                f"debezium.{key}='{escape(str(value))}'")
 
         # Add extra properties
-        for key, value in self.config.extra_properties.items():
-            with_items.append(f"{key}='{self._escape_sql_string(str(value))}'")
+        for key, value in config.extra_properties.items():
+            with_items.append(f"{key}='{escape(str(value))}'")
 
         with_clause = ",\n    ".join(with_items)
 
-        return f"""-- Step 1: Create the shared CDC source {self.config.source_name}
-CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
+        return f"""-- Step 1: Create the shared CDC source {config.source_name}
+CREATE SOURCE IF NOT EXISTS {config.source_name} WITH (
     {with_clause}
 );"""
 
@@ -490,9 +595,6 @@ CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
         # Optional TableColumnConfig
         column_config = kwargs.get('column_config')
 
-        # Build WITH clause for backfill configuration
-        with_items = []
-
         # Check for backfill parameters from config (global) or kwargs (table-specific)
         backfill_num_rows_per_split = kwargs.get(
             'backfill_num_rows_per_split') or self.config.backfill_num_rows_per_split
@@ -502,24 +604,9 @@ CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
         if backfill_as_even_splits is None:
             backfill_as_even_splits = self.config.backfill_as_even_splits
 
-        if backfill_num_rows_per_split is not None:
-            with_items.append(
-                f"backfill.num_rows_per_split='{backfill_num_rows_per_split}'")
-        if backfill_parallelism is not None:
-            with_items.append(f"backfill.parallelism='{backfill_parallelism}'")
-        if backfill_as_even_splits is not None:
-            with_items.append(
-                f"backfill.as_even_splits='{str(backfill_as_even_splits).lower()}'")
-
-        # Add snapshot parameter if provided
-        snapshot = kwargs.get('snapshot')
-        if snapshot is not None:
-            with_items.append(f"snapshot='{str(snapshot).lower()}'")
-
-        with_clause = ""
-        if with_items:
-            joined_items = ',\n    '.join(with_items)
-            with_clause = f"\nWITH (\n    {joined_items}\n)"
+        with_clause = _table_with_clause(
+            backfill_num_rows_per_split, backfill_parallelism,
+            backfill_as_even_splits, kwargs.get('snapshot'))
 
         qualified_table_name = f"{rw_schema}.{table_name}" if rw_schema != "public" else table_name
 
@@ -541,11 +628,8 @@ CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
                         'is_primary_key': col_selection.is_primary_key
                     }
             else:
-                # Create discovery instance to validate columns
-                discovery = PostgreSQLDiscovery(self.config)
-
                 # Validate column selection
-                validation_result = discovery.validate_column_selection(
+                validation_result = self.discovery.validate_column_selection(
                     table_info, column_config.selected_columns)
 
             if not validation_result['valid']:
@@ -1,12 +1,36 @@
-"""SQL Server-specific discovery and pipeline implementation."""
+"""SQL Server-specific discovery and pipeline implementation.
+
+Discovery is latency-bound on ODBC round-trips, not on Python CPU time:
+prefer batching queries, caching results and reusing the connection over
+micro-optimizing row handling. Enable DEBUG logging for this module to see
+how long each discovery query takes against your server.
+
+Importing this module turns off pyodbc's driver-manager connection pooling
+(``pyodbc.pooling = False``). pyodbc only exposes this as a process-wide
+setting read before the first connection, so it also applies to any other
+pyodbc connections opened in the same process. Set ``pyodbc.pooling = True``
+after importing this module if your application relies on ODBC pooling.
+"""
 
 from __future__ import annotations
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Union
+import sys
+import time
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Tuple, Union
 from contextlib import contextmanager
 
 try:
     import pyodbc
+    # Discovery keeps its own long-lived connection, so the driver manager's
+    # pool only adds overhead (and leaks memory under unixODBC). This is a
+    # process-wide setting; see the module docstring.
+    pyodbc.pooling = False
 except ImportError:
     pyodbc = None
 
@@ -18,11 +42,161 @@ from ..discovery.base import (
     SourceConfig,
     TableInfo,
     ColumnInfo,
-    ColumnSelection
+    ColumnSelection,
+    _NAME_TRANSLATE
 )
 
 logger = logging.getLogger(__name__)
 
+# SQL Server caps a single request at 2100 bound parameters; each
+# (schema, table) pair uses two of them.
+_MAX_PAIRS_PER_QUERY = 1000
+
+# Discovery queries. Schema and table names are always bound as parameters
+# so SQL Server can reuse one cached plan per statement.
+_SERVER_VERSION_SQL = "SELECT @@VERSION as version"
+
+_DATABASE_INFO_SQL = "SELECT DB_NAME() as database_name, SCHEMA_NAME() as default_schema"
+
+_LIST_SCHEMAS_SQL = """
+    SELECT DISTINCT SCHEMA_NAME
+    FROM INFORMATION_SCHEMA.SCHEMATA
+    WHERE SCHEMA_NAME NOT IN ('sys', 'information_schema')
+    ORDER BY SCHEMA_NAME
+"""
+
+# Callers append "AND t.TABLE_SCHEMA IN (?, ...)"
+_LIST_TABLES_SQL = """
+    SELECT t.TABLE_SCHEMA, t.TABLE_NAME, t.TABLE_TYPE
+    FROM INFORMATION_SCHEMA.TABLES t
+    WHERE t.TABLE_TYPE = 'BASE TABLE'
+"""
+
+_LIST_TABLES_WITH_ROW_COUNT_SQL = """
+    SELECT
+        t.TABLE_SCHEMA,
+        t.TABLE_NAME,
+        t.TABLE_TYPE,
+        ISNULL(p.rows, 0) as row_count
+    FROM INFORMATION_SCHEMA.TABLES t
+    LEFT JOIN (
+        SELECT
+            SCHEMA_NAME(o.schema_id) as schema_name,
+            o.name as table_name,
+            SUM(p.rows) as rows
+        FROM sys.objects o
+        JOIN sys.partitions p ON o.object_id = p.object_id
+        WHERE o.type = 'U' AND p.index_id IN (0, 1)
+        GROUP BY o.schema_id, o.name
+    ) p ON t.TABLE_SCHEMA = p.schema_name AND t.TABLE_NAME = p.table_name
+    WHERE t.TABLE_TYPE = 'BASE TABLE'
+"""
+
+_GET_SCHEMA_COLUMNS_SQL = """
+    SELECT
+        c.TABLE_NAME,
+        c.COLUMN_NAME,
+        c.DATA_TYPE,
+        c.IS_NULLABLE,
+        c.ORDINAL_POSITION,
+        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END as IS_PRIMARY_KEY
+    FROM INFORMATION_SCHEMA.COLUMNS c
+    LEFT JOIN (
+        SELECT ku.TABLE_NAME, ku.COLUMN_NAME
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE ku
+            ON tc.CONSTRAINT_SCHEMA = ku.CONSTRAINT_SCHEMA
+            AND tc.CONSTRAINT_NAME = ku.CONSTRAINT_NAME
+        WHERE tc.TABLE_SCHEMA = ?
+            AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+    ) pk ON c.TABLE_NAME = pk.TABLE_NAME AND c.COLUMN_NAME = pk.COLUMN_NAME
+    WHERE c.TABLE_SCHEMA = ?
+    ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+"""
+
+# Formatted with a "(?, ?), ..." VALUES list of (schema, table) pairs
+_GET_COLUMNS_FOR_TABLES_SQL = """
+    SELECT
+        c.TABLE_SCHEMA,
+        c.TABLE_NAME,
+        c.COLUMN_NAME,
+        c.DATA_TYPE,
+        c.IS_NULLABLE,
+        c.ORDINAL_POSITION,
+        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END as IS_PRIMARY_KEY
+    FROM INFORMATION_SCHEMA.COLUMNS c
+    JOIN (VALUES {values}) AS t(TABLE_SCHEMA, TABLE_NAME)
+        ON c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME
+    LEFT JOIN (
+        SELECT ku.TABLE_SCHEMA, ku.TABLE_NAME, ku.COLUMN_NAME
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE ku
+            ON tc.CONSTRAINT_SCHEMA = ku.CONSTRAINT_SCHEMA
+            AND tc.CONSTRAINT_NAME = ku.CONSTRAINT_NAME
+        WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+    ) pk ON c.TABLE_SCHEMA = pk.TABLE_SCHEMA
+        AND c.TABLE_NAME = pk.TABLE_NAME
+        AND c.COLUMN_NAME = pk.COLUMN_NAME
+    ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
+"""
+
+# SQL Server data types (lowercase) to RisingWave types
+_TYPE_MAP: Mapping[str, str] = MappingProxyType({
+    # Numeric types
+    'tinyint': 'SMALLINT',
+    'smallint': 'SMALLINT',
+    'int': 'INTEGER',
+    'bigint': 'BIGINT',
+    'decimal': 'DECIMAL',
+    'numeric': 'DECIMAL',
+    'float': 'DOUBLE PRECISION',
+    'real': 'REAL',
+    'money': 'DECIMAL(19,4)',
+    'smallmoney': 'DECIMAL(10,4)',
+
+    # String types
+    'char': 'CHAR',
+    'varchar': 'VARCHAR',
+    'text': 'TEXT',
+    'nchar': 'CHAR',
+    'nvarchar': 'VARCHAR',
+    'ntext': 'TEXT',
+
+    # Date/time types
+    'date': 'DATE',
+    'time': 'TIME',
+    'datetime': 'TIMESTAMP',
+    'datetime2': 'TIMESTAMP',
+    'smalldatetime': 'TIMESTAMP',
+    'datetimeoffset': 'TIMESTAMPTZ',
+
+    # Binary types
+    'binary': 'BYTEA',
+    'varbinary': 'BYTEA',
+    'image': 'BYTEA',
+
+    # Other types
+    'bit': 'BOOLEAN',
+    'uniqueidentifier': 'UUID',
+    'xml': 'TEXT',
+    'sql_variant': 'TEXT'
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_table_patterns(
+    table_name: str, default_schema: str
+) -> Tuple[Tuple[str, str, bool], ...]:
+    """Parse a table_name setting into (schema, table_pattern, is_wildcard) triples."""
+    parsed = []
+    for pattern in table_name.split(','):
+        pattern = pattern.strip()
+        schema_name, dot, table_pattern = pattern.partition('.')
+        if not dot:
+            schema_name, table_pattern = default_schema, pattern
+        parsed.append((schema_name, table_pattern, table_pattern == '*'))
+    return tuple(parsed)
+
 
 class SQLServerConfig(SourceConfig):
     """SQL Server-specific configuration.
@@ -85,24 +259,22 @@ class SQLServerConfig(SourceConfig):
             raise ValueError("port must be between 1 and 65535")
         return v
 
+    @property
+    def parsed_patterns(self) -> Tuple[Tuple[str, str, bool], ...]:
+        """Get (schema, table_pattern, is_wildcard) for each table pattern."""
+        return _parse_table_patterns(self.table_name, self.schema_name)
+
     def get_schema_names(self) -> List[str]:
         """Extract schema names from table patterns."""
-        schemas = set()
-        for pattern in self.table_name.split(','):
-            pattern = pattern.strip()
-            if '.' in pattern:
-                schema_name = pattern.split('.')[0]
-                schemas.add(schema_name)
-            else:
-                schemas.add(self.schema_name)
-        return list(schemas)
+        return list({schema for schema, _, _ in self.parsed_patterns})
 
     def get_table_patterns(self) -> List[str]:
         """Get list of table patterns."""
         return [pattern.strip() for pattern in self.table_name.split(',')]
 
-    def get_connection_string(self) -> str:
-        """Generate SQL Server connection string."""
+    @property
+    def connection_string(self) -> str:
+        """SQL Server connection string for the current settings."""
         driver = "{ODBC Driver 17 for SQL Server}"
         encrypt = "yes" if self.database_encrypt else "no"
 
@@ -114,8 +286,14 @@ class SQLServerConfig(SourceConfig):
             f"PWD={self.password};"
             f"Encrypt={encrypt};"
             "TrustServerCertificate=yes;"
+            # Largest packet SQL Server accepts; cuts round-trips on wide catalog reads
+            "PacketSize=32767;"
         )
 
+    def get_connection_string(self) -> str:
+        """Generate SQL Server connection string."""
+        return self.connection_string
+
 
 class SQLServerDiscovery(DatabaseDiscovery):
     """SQL Server database discovery implementation."""
@@ -123,39 +301,121 @@ class SQLServerDiscovery(DatabaseDiscovery):
     def __init__(self, config: SQLServerConfig):
         self.config = config
         self.connection_string = config.get_connection_string()
+        self._conn = None
+        self._cursor = None
+        # Columns per table, keyed by schema (see get_schema_columns)
+        self._schema_columns: Dict[str, Dict[str, List[ColumnInfo]]] = {}
+
+    def __enter__(self) -> "SQLServerDiscovery":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the cached SQL Server connection, if any.
+
+        Also drops the columns cached by get_schema_columns, so they live
+        no longer than the discovery session.
+        """
+        self._schema_columns.clear()
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing SQL Server connection: {e}")
+            finally:
+                self._conn = None
+                self._cursor = None
+
+    def _is_alive(self) -> bool:
+        """Check whether the cached connection still answers queries."""
+        try:
+            self._conn.cursor().execute("SELECT 1").fetchone()
+            return True
+        except Exception:
+            return False
+
+    def _connect(self) -> None:
+        """Open a new discovery connection, replacing any cached one."""
+        self.close()
+        # Discovery only reads metadata; autocommit avoids holding an
+        # open transaction (and its catalog locks) between calls
+        self._conn = pyodbc.connect(
+            self.connection_string, timeout=10, autocommit=True)
 
     @contextmanager
     def get_connection(self):
-        """Get SQL Server database connection."""
+        """Get the SQL Server database connection.
+
+        The connection is opened on first use and reused by later calls. If a
+        query finds that the reused connection has dropped, _execute()
+        reconnects and retries it once. If a call still fails and the
+        connection no longer responds, it is dropped so the next call
+        reconnects.
+        """
         if pyodbc is None:
             raise ImportError(
                 "pyodbc is required for SQL Server connectivity. "
                 "Install it with: pip install 'risingwave-connect-py[sqlserver]' or pip install pyodbc"
             )
 
-        conn = None
         try:
-            conn = pyodbc.connect(self.connection_string, timeout=10)
-            yield conn
+            if self._conn is None:
+                self._connect()
+            yield self._conn
         except Exception as e:
+            if self._conn is not None and not self._is_alive():
+                self.close()
             logger.error(f"Failed to connect to SQL Server: {e}")
             raise ConnectionError(f"SQL Server connection failed: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    @contextmanager
+    def get_cursor(self):
+        """Get a cursor on the cached connection, reused across discovery calls."""
+        with self.get_connection() as conn:
+            if self._cursor is None:
+                self._cursor = conn.cursor()
+            yield self._cursor
+
+    @staticmethod
+    def _run(cursor, query: str, params=()) -> None:
+        """Execute a query, binding params only when there are any."""
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+
+    def _execute(self, cursor, label: str, query: str, params=()):
+        """Execute a discovery query, logging its round-trip time at DEBUG.
+
+        If the query fails because the cached connection has dropped, open a
+        new connection and run it once more. Callers must read results from
+        the returned cursor, which is a new one after a reconnect.
+        """
+        start = time.perf_counter()
+        try:
+            self._run(cursor, query, params)
+        except Exception as e:
+            if self._conn is None or self._is_alive():
+                raise
+            logger.warning(f"SQL Server connection lost, reconnecting: {e}")
+            self._connect()
+            cursor = self._cursor = self._conn.cursor()
+            self._run(cursor, query, params)
+        logger.debug(
+            f"SQL Server {label} query took {(time.perf_counter() - start) * 1000:.1f} ms")
+        return cursor
 
     def test_connection(self) -> Dict[str, Any]:
         """Test SQL Server connection."""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT @@VERSION as version")
+            with self.get_cursor() as cursor:
+                cursor = self._execute(cursor, 'server_version', _SERVER_VERSION_SQL)
                 result = cursor.fetchone()
 
                 # Get database info
-                cursor.execute(
-                    "SELECT DB_NAME() as database_name, SCHEMA_NAME() as default_schema"
-                )
+                cursor = self._execute(cursor, 'database_info', _DATABASE_INFO_SQL)
                 db_info = cursor.fetchone()
 
                 return {
@@ -175,109 +435,124 @@ class SQLServerDiscovery(DatabaseDiscovery):
     def list_schemas(self) -> List[str]:
         """List available schemas in SQL Server database."""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT DISTINCT SCHEMA_NAME 
-                    FROM INFORMATION_SCHEMA.SCHEMATA 
-                    WHERE SCHEMA_NAME NOT IN ('sys', 'information_schema')
-                    ORDER BY SCHEMA_NAME
-                """)
-
-                schemas = [row.SCHEMA_NAME for row in cursor.fetchall()]
+            with self.get_cursor() as cursor:
+                cursor = self._execute(cursor, 'list_schemas', _LIST_SCHEMAS_SQL)
+
+                schemas = [schema for (schema,) in cursor]
                 return schemas
         except Exception as e:
             logger.error(f"Failed to list schemas: {e}")
             return []
 
-    def list_tables(self, schema_name: Optional[str] = None) -> List[TableInfo]:
-        """List available tables in SQL Server database."""
+    def list_tables(
+        self,
+        schema_name: Optional[str] = None,
+        schema_names: Optional[List[str]] = None,
+        include_row_count: bool = False
+    ) -> List[TableInfo]:
+        """List available tables in SQL Server database.
+
+        Args:
+            schema_name: Schema to list (defaults to the config schema)
+            schema_names: List several schemas at once; takes precedence over schema_name
+            include_row_count: Also fetch approximate row counts. This aggregates
+                sys.partitions, which is expensive on large servers, so it is off by default.
+        """
+        try:
+            return list(self.iter_tables(schema_name, schema_names, include_row_count))
+        except Exception:
+            # Already logged by iter_tables; never return a partial listing
+            return []
+
+    def iter_tables(
+        self,
+        schema_name: Optional[str] = None,
+        schema_names: Optional[List[str]] = None,
+        include_row_count: bool = False
+    ) -> Iterator[TableInfo]:
+        """Yield tables as rows arrive instead of building the full list.
+
+        Takes the same arguments as list_tables(). The discovery cursor is
+        shared, so finish or discard the iterator before issuing another query.
+        Query errors are raised from the iterator, even after some tables
+        have been yielded.
+        """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Use provided schema or default to config schema
-                target_schema = schema_name or self.config.schema_name
-
-                # Query for tables with row counts
-                query = """
-                    SELECT 
-                        t.TABLE_SCHEMA,
-                        t.TABLE_NAME,
-                        ISNULL(p.rows, 0) as row_count
-                    FROM INFORMATION_SCHEMA.TABLES t
-                    LEFT JOIN (
-                        SELECT 
-                            SCHEMA_NAME(o.schema_id) as schema_name,
-                            o.name as table_name,
-                            SUM(p.rows) as rows
-                        FROM sys.objects o
-                        JOIN sys.partitions p ON o.object_id = p.object_id
-                        WHERE o.type = 'U' AND p.index_id IN (0, 1)
-                        GROUP BY o.schema_id, o.name
-                    ) p ON t.TABLE_SCHEMA = p.schema_name AND t.TABLE_NAME = p.table_name
-                    WHERE t.TABLE_TYPE = 'BASE TABLE'
-                """
-
-                if target_schema:
-                    query += " AND t.TABLE_SCHEMA = ?"
-                    cursor.execute(query, (target_schema,))
-                else:
-                    cursor.execute(query)
-
-                tables = []
-                for row in cursor.fetchall():
-                    tables.append(TableInfo(
-                        schema_name=row.TABLE_SCHEMA,
-                        table_name=row.TABLE_NAME,
-                        table_type=row.TABLE_TYPE,
-                        row_count=None,  # Could be fetched with additional query
+            with self.get_cursor() as cursor:
+
+                # Use provided schemas or default to config schema
+                target_schemas = schema_names or [
+                    schema_name or self.config.schema_name]
+
+                query = (_LIST_TABLES_WITH_ROW_COUNT_SQL if include_row_count
+                         else _LIST_TABLES_SQL)
+
+                placeholders = ", ".join(["?"] * len(target_schemas))
+                query += f" AND t.TABLE_SCHEMA IN ({placeholders})"
+                cursor = self._execute(cursor, 'list_tables', query, target_schemas)
+
+                for schema, name, table_type, *row_count in cursor:
+                    # Schema and type repeat on every row; intern them so all
+                    # TableInfo objects share one string each
+                    yield TableInfo(
+                        schema_name=sys.intern(schema),
+                        table_name=name,
+                        table_type=sys.intern(table_type),
+                        row_count=row_count[0] if row_count else None,
                         size_bytes=None,  # Could be fetched with additional query
                         comment=None
-                    ))
-
-                return tables
+                    )
         except Exception as e:
             logger.error(f"Failed to list tables: {e}")
-            return []
+            raise
 
     def check_specific_tables(self, table_patterns: List[str]) -> List[TableInfo]:
         """Check if specific tables exist and return their info."""
         found_tables = []
 
         try:
-            all_tables = self.list_tables()
-
+            # Resolve each pattern to (schema, table or None for 'schema.*')
+            targets: List[Tuple[str, Optional[str]]] = []
             for pattern in table_patterns:
-                pattern = pattern.strip()
-
-                if pattern.endswith('.*'):
-                    # Schema-level pattern (e.g., 'dbo.*')
-                    schema_prefix = pattern[:-2]
-                    matching_tables = [
-                        table for table in all_tables
-                        if table.schema_name == schema_prefix
-                    ]
-                    found_tables.extend(matching_tables)
-                elif '.' in pattern:
-                    # Specific table (e.g., 'dbo.users')
-                    schema_name, table_name = pattern.split('.', 1)
-                    matching_table = next(
-                        (table for table in all_tables
-                         if table.schema_name == schema_name and table.table_name == table_name),
-                        None
-                    )
-                    if matching_table:
-                        found_tables.append(matching_table)
-                else:
+                schema_name, dot, table_name = pattern.strip().partition('.')
+                if not dot:
                     # Table name without schema, use default schema
-                    matching_table = next(
-                        (table for table in all_tables
-                         if table.table_name == pattern and table.schema_name == self.config.schema_name),
-                        None
-                    )
-                    if matching_table:
-                        found_tables.append(matching_table)
+                    schema_name, table_name = self.config.schema_name, schema_name
+                targets.append(
+                    (schema_name, None if table_name == '*' else table_name))
+
+            # Exact names let us stop reading once they've all been seen;
+            # a wildcard needs every table in its schema
+            remaining = {target for target in targets if target[1] is not None}
+            needs_full_scan = len(remaining) < len(targets)
+
+            # Index once so each pattern is a dict lookup instead of a scan
+            by_qualified: Dict[Tuple[str, str], TableInfo] = {}
+            by_schema: Dict[str, List[TableInfo]] = defaultdict(list)
+            schema_names = list(dict.fromkeys(schema for schema, _ in targets))
+            for table in self.iter_tables(schema_names=schema_names):
+                key = (table.schema_name, table.table_name)
+                by_qualified[key] = table
+                by_schema[table.schema_name].append(table)
+
+                remaining.discard(key)
+                if not remaining and not needs_full_scan:
+                    break
+
+            seen = set()
+            for schema_name, table_name in targets:
+                if table_name is None:
+                    matching_tables = by_schema.get(schema_name, [])
+                else:
+                    matching_table = by_qualified.get((schema_name, table_name))
+                    matching_tables = [matching_table] if matching_table else []
+
+                # Overlapping patterns (e.g. 'dbo.*' and 'dbo.users') match once
+                for table in matching_tables:
+                    key = (table.schema_name, table.table_name)
+                    if key not in seen:
+                        seen.add(key)
+                        found_tables.append(table)
 
         except Exception as e:
             logger.error(f"Failed to check specific tables: {e}")
@@ -287,94 +562,157 @@ class SQLServerDiscovery(DatabaseDiscovery):
     def get_table_columns(self, schema_name: str, table_name: str) -> List[ColumnInfo]:
         """Get column information for a specific table."""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get column information including primary keys
-                query = """
-                    SELECT 
-                        c.COLUMN_NAME,
-                        c.DATA_TYPE,
-                        c.IS_NULLABLE,
-                        c.ORDINAL_POSITION,
-                        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END as IS_PRIMARY_KEY
-                    FROM INFORMATION_SCHEMA.COLUMNS c
-                    LEFT JOIN (
-                        SELECT ku.COLUMN_NAME
-                        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE ku 
-                            ON tc.CONSTRAINT_NAME = ku.CONSTRAINT_NAME
-                        WHERE tc.TABLE_SCHEMA = ? 
-                            AND tc.TABLE_NAME = ?
-                            AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-                    ) pk ON c.COLUMN_NAME = pk.COLUMN_NAME
-                    WHERE c.TABLE_SCHEMA = ? AND c.TABLE_NAME = ?
-                    ORDER BY c.ORDINAL_POSITION
-                """
-
-                cursor.execute(
-                    query, (schema_name, table_name, schema_name, table_name))
-
-                columns = []
-                for row in cursor.fetchall():
-                    columns.append(ColumnInfo(
-                        column_name=row.COLUMN_NAME,
-                        data_type=self._map_sqlserver_type_to_risingwave(
-                            row.DATA_TYPE),
-                        is_nullable=row.IS_NULLABLE == "YES",
-                        is_primary_key=bool(row.IS_PRIMARY_KEY),
-                        ordinal_position=row.ORDINAL_POSITION
-                    ))
-
-                return columns
+            return self.get_columns_for_tables(
+                [(schema_name, table_name)]).get((schema_name, table_name), [])
         except Exception as e:
             logger.error(f"Failed to get table columns: {e}")
             return []
 
-    def _map_sqlserver_type_to_risingwave(self, sqlserver_type: str) -> str:
-        """Map SQL Server data types to RisingWave types."""
-        type_mapping = {
-            # Numeric types
-            'tinyint': 'SMALLINT',
-            'smallint': 'SMALLINT',
-            'int': 'INTEGER',
-            'bigint': 'BIGINT',
-            'decimal': 'DECIMAL',
-            'numeric': 'DECIMAL',
-            'float': 'DOUBLE PRECISION',
-            'real': 'REAL',
-            'money': 'DECIMAL(19,4)',
-            'smallmoney': 'DECIMAL(10,4)',
-
-            # String types
-            'char': 'CHAR',
-            'varchar': 'VARCHAR',
-            'text': 'TEXT',
-            'nchar': 'CHAR',
-            'nvarchar': 'VARCHAR',
-            'ntext': 'TEXT',
-
-            # Date/time types
-            'date': 'DATE',
-            'time': 'TIME',
-            'datetime': 'TIMESTAMP',
-            'datetime2': 'TIMESTAMP',
-            'smalldatetime': 'TIMESTAMP',
-            'datetimeoffset': 'TIMESTAMPTZ',
-
-            # Binary types
-            'binary': 'BYTEA',
-            'varbinary': 'BYTEA',
-            'image': 'BYTEA',
-
-            # Other types
-            'bit': 'BOOLEAN',
-            'uniqueidentifier': 'UUID',
-            'xml': 'TEXT',
-            'sql_variant': 'TEXT'
-        }
+    def get_schema_columns(self, schema_name: str) -> Dict[str, List[ColumnInfo]]:
+        """Get column information for every table in a schema.
 
-        return type_mapping.get(sqlserver_type.lower(), 'TEXT')
+        All columns and primary keys of the schema come back from a single
+        query. The result is cached on this discovery instance, so later
+        lookups for any table in the schema don't query the server again.
+
+        Returns:
+            Dict mapping table name to its columns, ordered by ordinal position
+        """
+        cached = self._schema_columns.get(schema_name)
+        if cached is not None:
+            return cached
+
+        try:
+            with self.get_cursor() as cursor:
+                cursor = self._execute(
+                    cursor, 'get_schema_columns', _GET_SCHEMA_COLUMNS_SQL, (schema_name, schema_name))
+
+                map_type = _TYPE_MAP.get
+                columns_by_table: Dict[str, List[ColumnInfo]] = {}
+                for table_name, table_rows in groupby(cursor, key=itemgetter(0)):
+                    columns_by_table[table_name] = [
+                        ColumnInfo(
+                            column_name=name,
+                            data_type=map_type(data_type.lower(), 'TEXT'),
+                            is_nullable=is_nullable == "YES",
+                            is_primary_key=bool(is_pk),
+                            ordinal_position=position
+                        )
+                        for _, name, data_type, is_nullable, position, is_pk in table_rows
+                    ]
+
+                self._schema_columns[schema_name] = columns_by_table
+                return columns_by_table
+        except Exception as e:
+            logger.error(f"Failed to get table columns: {e}")
+            return {}
+
+    def get_columns_for_tables(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], List[ColumnInfo]]:
+        """Get column information for many tables in a single round-trip.
+
+        Args:
+            pairs: List of (schema_name, table_name) tuples
+
+        Returns:
+            Dict mapping (schema_name, table_name) to its columns, ordered by
+            ordinal position. Tables that don't exist are omitted.
+
+        Raises:
+            ConnectionError: If the query fails, rather than returning
+                partial results
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+
+        columns_by_table: Dict[Tuple[str, str], List[ColumnInfo]] = {}
+        with self.get_cursor() as cursor:
+            map_type = _TYPE_MAP.get
+
+            for start in range(0, len(pairs), _MAX_PAIRS_PER_QUERY):
+                batch = pairs[start:start + _MAX_PAIRS_PER_QUERY]
+                values_sql = ", ".join(["(?, ?)"] * len(batch))
+                query = _GET_COLUMNS_FOR_TABLES_SQL.format(values=values_sql)
+                params = [value for pair in batch for value in pair]
+                cursor = self._execute(cursor, 'get_columns_for_tables', query, params)
+
+                # Rows arrive ordered by table, so group them as they stream in
+                for key, table_rows in groupby(cursor, key=itemgetter(0, 1)):
+                    columns_by_table[key] = [
+                        ColumnInfo(
+                            column_name=name,
+                            data_type=map_type(data_type.lower(), 'TEXT'),
+                            is_nullable=is_nullable == "YES",
+                            is_primary_key=bool(is_pk),
+                            ordinal_position=position
+                        )
+                        for _, _, name, data_type, is_nullable, position, is_pk in table_rows
+                    ]
+
+        return columns_by_table
+
+    async def alist_tables(
+        self,
+        schema_names: Optional[List[str]] = None,
+        include_row_count: bool = False,
+        max_concurrency: int = 8
+    ) -> List[TableInfo]:
+        """List tables across schemas, querying each schema concurrently.
+
+        Each schema is listed on a worker thread over its own connection, so
+        round-trips to distant servers overlap instead of running back to back.
+        """
+        schemas = list(dict.fromkeys(schema_names or [self.config.schema_name]))
+        results = await self._gather_per_schema(
+            schemas,
+            lambda discovery, schema: discovery.list_tables(
+                schema_name=schema, include_row_count=include_row_count),
+            max_concurrency
+        )
+        return [table for tables in results for table in tables]
+
+    async def aget_columns_for_tables(
+        self,
+        pairs: List[Tuple[str, str]],
+        max_concurrency: int = 8
+    ) -> Dict[Tuple[str, str], List[ColumnInfo]]:
+        """Async get_columns_for_tables() that fetches each schema concurrently."""
+        pairs_by_schema: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for pair in dict.fromkeys(pairs):
+            pairs_by_schema[pair[0]].append(pair)
+
+        results = await self._gather_per_schema(
+            list(pairs_by_schema),
+            lambda discovery, schema: discovery.get_columns_for_tables(
+                pairs_by_schema[schema]),
+            max_concurrency
+        )
+        columns_by_table: Dict[Tuple[str, str], List[ColumnInfo]] = {}
+        for columns in results:
+            columns_by_table.update(columns)
+        return columns_by_table
+
+    async def _gather_per_schema(self, schemas: List[str], fetch, max_concurrency: int) -> List[Any]:
+        """Run fetch(discovery, schema) for each schema on worker threads."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(schema: str):
+            async with semaphore:
+                return await asyncio.to_thread(self._fetch_on_own_connection, fetch, schema)
+
+        return await asyncio.gather(*(run(schema) for schema in schemas))
+
+    def _fetch_on_own_connection(self, fetch, schema: str):
+        # pyodbc connections must not be shared between threads
+        with SQLServerDiscovery(self.config) as discovery:
+            return fetch(discovery, schema)
+
+    @staticmethod
+    def _map_sqlserver_type_to_risingwave(sqlserver_type: str) -> str:
+        """Map SQL Server data types to RisingWave types."""
+        return _TYPE_MAP.get(sqlserver_type.lower(), 'TEXT')
 
     def validate_column_selection(self, table_info: TableInfo, column_selections: List[ColumnSelection]) -> Dict[str, Any]:
         """Validate column selection against SQL Server table schema."""
@@ -448,37 +786,46 @@ class SQLServerDiscovery(DatabaseDiscovery):
 class SQLServerSourceConnection(SourceConnection):
     """SQL Server CDC source connection implementation."""
 
-    def __init__(self, rw_client, config: SQLServerConfig):
+    def __init__(self, rw_client, config: SQLServerConfig,
+                 discovery: Optional[SQLServerDiscovery] = None):
         super().__init__(rw_client, config)
         self.config: SQLServerConfig = config
+        self._discovery: Optional[SQLServerDiscovery] = discovery
+
+    @property
+    def discovery(self) -> SQLServerDiscovery:
+        """Discovery used to look up table columns, created on first use."""
+        if self._discovery is None:
+            self._discovery = SQLServerDiscovery(self.config)
+        return self._discovery
 
     def _generate_source_name(self) -> str:
         """Generate a default source name for SQL Server."""
-        clean_db = self.config.database.replace(
-            '-', '_').replace('.', '_').replace(' ', '_')
+        clean_db = self.config.database.translate(_NAME_TRANSLATE)
         base_name = f"sqlserver_cdc_{clean_db}"
         return base_name
 
     def create_source_sql(self) -> str:
         """Generate CREATE SOURCE SQL for SQL Server CDC."""
+        escape = self._escape_sql_string
         with_items = [
             "connector='sqlserver-cdc'",
-            f"hostname='{self._escape_sql_string(self.config.hostname)}'",
+            f"hostname='{escape(self.config.hostname)}'",
             f"port='{self.config.port}'",
-            f"username='{self._escape_sql_string(self.config.username)}'",
-            f"password='{self._escape_sql_string(self.config.password)}'",
-            f"database.name='{self._escape_sql_string(self.config.database)}'",
+            f"username='{escape(self.config.username)}'",
+            f"password='{escape(self.config.password)}'",
+            f"database.name='{escape(self.config.database)}'",
         ]
 
         if self.config.database_encrypt:
             with_items.append("database.encrypt='true'")
 
-        with_clause = ",\n    ".join(with_items)
-
-        return f"""-- Step 1: Create the SQL Server CDC source {self.config.source_name}
-CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
-    {with_clause}
-);"""
+        return "\n".join([
+            f"-- Step 1: Create the SQL Server CDC source {self.config.source_name}",
+            f"CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (",
+            "    " + ",\n    ".join(with_items),
+            ");",
+        ])
 
     def create_table_sql(self, table_info: TableInfo, **kwargs) -> str:
         """Generate CREATE TABLE SQL for SQL Server CDC.
@@ -493,6 +840,8 @@ CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
                 - include_schema_name: Whether to include schema name metadata (default: False)
                 - include_table_name: Whether to include table name metadata (default: False)
                 - column_config: TableColumnConfig for column filtering
+                - table_columns: Pre-fetched columns for this table (see
+                  SQLServerDiscovery.get_columns_for_tables); fetched on demand if omitted
         """
         table_name = kwargs.get('table_name', table_info.table_name)
         rw_schema = kwargs.get('rw_schema', 'public')
@@ -511,25 +860,33 @@ CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
                 table_info, column_config.column_selections)
         else:
             # Use all columns
-            table_columns = SQLServerDiscovery(self.config).get_table_columns(
-                table_info.schema_name, table_info.table_name
-            )
+            table_columns = kwargs.get('table_columns')
+            if table_columns is None:
+                table_columns = self.discovery.get_table_columns(
+                    table_info.schema_name, table_info.table_name
+                )
             columns_sql = self._generate_columns_sql(table_columns)
 
+        # Format row count for comment
+        row_count_str = f"{table_info.row_count:,}" if table_info.row_count is not None else "unknown"
+
+        parts = [
+            f"-- SQL Server CDC Table: {qualified_table_name}",
+            f"-- Source: {table_info.qualified_name} ({row_count_str} rows)",
+            f"CREATE TABLE IF NOT EXISTS {qualified_table_name} (",
+            f"    {columns_sql}",
+            ")",
+        ]
+
         # Include clauses for metadata
-        include_clauses = []
         if include_timestamp:
-            include_clauses.append("INCLUDE timestamp AS commit_ts")
+            parts.append("INCLUDE timestamp AS commit_ts")
         if include_database_name:
-            include_clauses.append("INCLUDE database_name AS database_name")
+            parts.append("INCLUDE database_name AS database_name")
         if include_schema_name:
-            include_clauses.append("INCLUDE schema_name AS schema_name")
+            parts.append("INCLUDE schema_name AS schema_name")
         if include_table_name:
-            include_clauses.append("INCLUDE table_name AS table_name")
-
-        include_sql = ""
-        if include_clauses:
-            include_sql = "\n" + "\n".join(include_clauses)
+            parts.append("INCLUDE table_name AS table_name")
 
         # WITH clause options
         with_items = []
@@ -542,24 +899,18 @@ CREATE SOURCE IF NOT EXISTS {self.config.source_name} WITH (
             with_items.append(
                 f"snapshot.batch_size='{self.config.snapshot_batch_size}'")
 
-        with_sql = ""
         if with_items:
-            with_sql = f"\nWITH (\n    {', '.join(with_items)}\n)"
-
-        # Format row count for comment
-        row_count_str = f"{table_info.row_count:,}" if table_info.row_count is not None else "unknown"
+            parts.extend(["WITH (", f"    {', '.join(with_items)}", ")"])
 
-        return f"""-- SQL Server CDC Table: {qualified_table_name}
--- Source: {table_info.qualified_name} ({row_count_str} rows)
-CREATE TABLE IF NOT EXISTS {qualified_table_name} (
-    {columns_sql}
-){include_sql}{with_sql}
-FROM {self.config.source_name} TABLE '{table_info.qualified_name}';"""
+        parts.append(
+            f"FROM {self.config.source_name} TABLE '{table_info.qualified_name}';")
+        return "\n".join(parts)
 
     def _generate_columns_sql(self, columns: List[ColumnInfo]) -> str:
         """Generate column definitions SQL."""
         column_defs = []
         pk_columns = []
+        pk_indices = []
 
         for col in columns:
             nullable = "" if col.is_nullable else " NOT NULL"
@@ -567,34 +918,18 @@ FROM {self.config.source_name} TABLE '{table_info.qualified_name}';"""
 
             if col.is_primary_key:
                 pk_columns.append(col.column_name)
+                pk_indices.append(len(column_defs))
 
             column_defs.append(column_def)
 
-        # Add primary key constraint
-        if pk_columns:
-            if len(pk_columns) == 1:
-                # Single column primary key - add inline
-                for i, col_def in enumerate(column_defs):
-                    if col_def.startswith(pk_columns[0] + " "):
-                        column_defs[i] = col_def.replace(
-                            pk_columns[0] + " ", f"{pk_columns[0]} ", 1)
-                        if " NOT NULL" in column_defs[i]:
-                            column_defs[i] = column_defs[i].replace(
-                                " NOT NULL", " PRIMARY KEY")
-                        else:
-                            column_defs[i] += " PRIMARY KEY"
-                        break
-            else:
-                # Multi-column primary key
-                pk_constraint = f"PRIMARY KEY ({', '.join(pk_columns)})"
-                column_defs.append(pk_constraint)
-
+        self._add_primary_key(column_defs, pk_columns, pk_indices)
         return ",\n    ".join(column_defs)
 
     def _generate_filtered_columns_sql(self, table_info: TableInfo, column_selections: List[ColumnSelection]) -> str:
         """Generate filtered column definitions SQL."""
         column_defs = []
         pk_columns = []
+        pk_indices = []
 
         for col_selection in column_selections:
             data_type = col_selection.risingwave_type or "TEXT"
@@ -603,28 +938,30 @@ FROM {self.config.source_name} TABLE '{table_info.qualified_name}';"""
 
             if col_selection.is_primary_key:
                 pk_columns.append(col_selection.column_name)
+                pk_indices.append(len(column_defs))
 
             column_defs.append(column_def)
 
-        # Add primary key constraint
-        if pk_columns:
-            if len(pk_columns) == 1:
-                # Single column primary key - add inline
-                for i, col_def in enumerate(column_defs):
-                    if col_def.startswith(pk_columns[0] + " "):
-                        if " NOT NULL" in column_defs[i]:
-                            column_defs[i] = column_defs[i].replace(
-                                " NOT NULL", " PRIMARY KEY")
-                        else:
-                            column_defs[i] += " PRIMARY KEY"
-                        break
-            else:
-                # Multi-column primary key
-                pk_constraint = f"PRIMARY KEY ({', '.join(pk_columns)})"
-                column_defs.append(pk_constraint)
-
+        self._add_primary_key(column_defs, pk_columns, pk_indices)
         return ",\n    ".join(column_defs)
 
+    @staticmethod
+    def _add_primary_key(column_defs: List[str], pk_columns: List[str], pk_indices: List[int]) -> None:
+        """Add the primary key to column definitions in place.
+
+        A single-column key is declared inline on its definition (found by
+        index), a composite key as a trailing PRIMARY KEY constraint.
+        """
+        if len(pk_columns) == 1:
+            i = pk_indices[0]
+            if " NOT NULL" in column_defs[i]:
+                column_defs[i] = column_defs[i].replace(
+                    " NOT NULL", " PRIMARY KEY")
+            else:
+                column_defs[i] += " PRIMARY KEY"
+        elif pk_columns:
+            column_defs.append(f"PRIMARY KEY ({', '.join(pk_columns)})")
+
     def _escape_sql_string(self, value: str) -> str:
         """Escape single quotes in SQL strings."""
         return value.replace("'", "''")
@@ -0,0 +1,35 @@
+"""Tests for the RisingWave client."""
+
+import pytest
+import psycopg
+from unittest.mock import MagicMock, patch
+from risingwave_connect.client import RisingWaveClient
+
+
+class TestRisingWaveClient:
+    """Test RisingWave client statement execution."""
+
+    @patch('risingwave_connect.client.psycopg.connect')
+    def test_execute_many_uses_one_connection(self, mock_connect):
+        """Test that a batch of statements shares a single connection."""
+        mock_cursor = mock_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        client = RisingWaveClient("postgresql://root@localhost:4566/dev")
+
+        executed = client.execute_many(["CREATE SOURCE s", "CREATE TABLE t"])
+
+        assert executed == 2
+        mock_connect.assert_called_once()
+        assert [c.args[0] for c in mock_cursor.execute.call_args_list] == [
+            "CREATE SOURCE s", "CREATE TABLE t"]
+
+    @patch('risingwave_connect.client.psycopg.connect')
+    def test_execute_many_stops_at_first_failure(self, mock_connect):
+        """Test that statements after a failing one are not executed."""
+        mock_cursor = mock_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        mock_cursor.execute.side_effect = [None, psycopg.Error("bad"), None]
+        client = RisingWaveClient("postgresql://root@localhost:4566/dev")
+
+        with pytest.raises(psycopg.Error):
+            client.execute_many(["a", "b", "c"])
+
+        assert mock_cursor.execute.call_count == 2
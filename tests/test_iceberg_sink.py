@@ -1,8 +1,15 @@
 """Tests for Iceberg sink implementation."""
 
+import asyncio
+import threading
+import time
 import pytest
+from unittest.mock import Mock
 from pydantic import ValidationError
+from risingwave_connect.client import RisingWaveClient
 from risingwave_connect.sinks.iceberg import IcebergConfig, IcebergSink
+from risingwave_connect.builders.sinks import SinkBuilder
+from risingwave_connect.connect_builder import ConnectBuilder
 
 
 class TestIcebergConfig:
@@ -131,6 +138,21 @@ class TestIcebergConfig:
                 s3_region="us-west-2"
             )
 
+    def test_invalid_retry_and_compaction_settings(self):
+        """Test invalid commit retry number and compaction interval."""
+        base = dict(
+            sink_name="invalid_sink",
+            warehouse_path="s3://bucket/warehouse",
+            database_name="test_db",
+            table_name="test_table",
+            catalog_type="storage",
+            s3_region="us-west-2"
+        )
+        with pytest.raises(ValueError, match="commit_retry_num must be non-negative"):
+            IcebergConfig(**base, commit_retry_num=-1)
+        with pytest.raises(ValueError, match="compaction_interval_sec must be positive"):
+            IcebergConfig(**base, compaction_interval_sec=0)
+
 
 class TestIcebergSink:
     """Test IcebergSink functionality."""
@@ -400,6 +422,23 @@ class TestIcebergSink:
         assert result.error_message is not None
         assert "warehouse_path is required" in result.error_message
 
+    def test_qualified_sink_name(self):
+        """Test that sinks outside the public schema are schema-qualified."""
+        config = IcebergConfig(
+            sink_name="test_sink",
+            schema_name="analytics",
+            warehouse_path="s3://bucket/warehouse",
+            database_name="test_db",
+            table_name="test_table",
+            catalog_type="storage",
+            s3_region="us-west-2"
+        )
+
+        sql = IcebergSink(config).create_sink_sql("source_table")
+
+        assert config.qualified_sink_name == "analytics.test_sink"
+        assert sql.startswith("CREATE SINK IF NOT EXISTS analytics.test_sink\n")
+
     def test_extra_properties(self):
         """Test extra properties are included in SQL."""
         config = IcebergConfig(
@@ -437,3 +476,130 @@ class TestIcebergSink:
 
         # Single quote should be escaped
         assert "database.name='test''db'" in sql
+
+
+class TestSinkBuilderIceberg:
+    """Test SinkBuilder execution of Iceberg sinks."""
+
+    def test_executes_each_table_sink(self):
+        """Test that every table's sink SQL is executed and results keep table order."""
+        def execute(sql):
+            if "orders" in sql:
+                raise RuntimeError("boom")
+
+        rw_client = Mock(spec=RisingWaveClient)
+        rw_client.execute.side_effect = execute
+        config = IcebergConfig(
+            sink_name="test_sink",
+            warehouse_path="s3://bucket/warehouse",
+            database_name="test_db",
+            table_name="test_table",
+            catalog_type="storage",
+            s3_region="us-west-2"
+        )
+
+        result = SinkBuilder(rw_client).create_sink(
+            config, ["users", "orders", "items"])
+
+        assert rw_client.execute.call_count == 3
+        assert [r.source_table for r in result["sink_results"]] == ["users", "items"]
+        assert [r.source_table for r in result["failed_results"]] == ["orders"]
+        assert "boom" in result["failed_results"][0].error_message
+
+    def test_each_table_gets_its_own_sink_name(self):
+        """Test that executed SQL uses a distinct sink name per source table."""
+        rw_client = Mock(spec=RisingWaveClient)
+        config = IcebergConfig(
+            sink_name="test_sink",
+            warehouse_path="s3://bucket/warehouse",
+            database_name="test_db",
+            table_name="test_table",
+            catalog_type="storage",
+            s3_region="us-west-2"
+        )
+
+        result = SinkBuilder(rw_client).create_sink(
+            config, ["public.users", "orders"])
+
+        executed = sorted(call.args[0] for call in rw_client.execute.call_args_list)
+        assert "CREATE SINK IF NOT EXISTS test_sink_orders" in executed[0]
+        assert "CREATE SINK IF NOT EXISTS test_sink_public_users" in executed[1]
+        assert [r.sink_name for r in result["sink_results"]] == [
+            "test_sink_public_users", "test_sink_orders"]
+        assert config.sink_name == "test_sink"
+
+    def test_max_inflight_bounds_concurrent_executions(self):
+        """Test that no more than max_inflight sink statements run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def execute(sql):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        rw_client = Mock(spec=RisingWaveClient)
+        rw_client.execute.side_effect = execute
+        config = IcebergConfig(
+            sink_name="test_sink",
+            warehouse_path="s3://bucket/warehouse",
+            database_name="test_db",
+            table_name="test_table",
+            catalog_type="storage",
+            s3_region="us-west-2"
+        )
+
+        with ConnectBuilder(rw_client, max_inflight_sinks=2) as builder:
+            builder.create_sink(config, [f"table_{i}" for i in range(6)])
+
+        assert rw_client.execute.call_count == 6
+        assert 1 <= peak <= 2
+
+        with pytest.raises(ValueError):
+            SinkBuilder(Mock(spec=RisingWaveClient), max_inflight=0)
+
+    def test_acreate_sinks_returns_results_in_config_order(self):
+        """Test creating several sinks concurrently through ConnectBuilder."""
+        configs = [
+            IcebergConfig(
+                sink_name=f"sink_{i}",
+                warehouse_path="s3://bucket/warehouse",
+                database_name="test_db",
+                table_name="test_table",
+                catalog_type="storage",
+                s3_region="us-west-2"
+            )
+            for i in range(3)
+        ]
+
+        results = asyncio.run(ConnectBuilder(Mock()).acreate_sinks(
+            configs, ["users"], dry_run=True, max_concurrency=2))
+
+        assert [r["sink_results"][0].sink_name for r in results] == [
+            "sink_0", "sink_1", "sink_2"]
+
+    def test_custom_query_for_single_table(self):
+        """Test passing a custom query directly for a single source table."""
+        config = IcebergConfig(
+            sink_name="test_sink",
+            warehouse_path="s3://bucket/warehouse",
+            database_name="test_db",
+            table_name="test_table",
+            catalog_type="storage",
+            s3_region="us-west-2"
+        )
+        builder = SinkBuilder(Mock())
+
+        result = builder.create_sink(
+            config, ["users"], dry_run=True,
+            custom_query="SELECT id FROM users WHERE active")
+
+        assert "SELECT id FROM users WHERE active" in result["sql_statements"][0]
+        with pytest.raises(ValueError):
+            builder.create_sink(config, ["users", "orders"], dry_run=True,
+                                custom_query="SELECT 1")
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from risingwave_connect.sources.mongodb import MongoDBConfig, MongoDBDiscovery, MongoDBSourceConnection
 from risingwave_connect.discovery.base import TableInfo
+from risingwave_connect.builders.mongodb import MongoDBBuilder
 
 
 class TestMongoDBConfig:
@@ -289,3 +290,43 @@ class TestMongoDBSourceConnection:
         # Test None
         escaped = connection._escape_sql_string(None)
         assert escaped == ""
+
+
+class TestMongoDBBuilder:
+    """Test MongoDB builder table resolution."""
+
+    @patch('risingwave_connect.sources.mongodb.MongoClient')
+    def test_dry_run_with_specific_collections_skips_discovery(self, mock_mongo_client):
+        """Test that explicit collections in dry run do not contact MongoDB."""
+        config = MongoDBConfig(
+            mongodb_url="mongodb://localhost:27017/?replicaSet=rs0",
+            collection_name="mydb.*",
+            database_name="mydb"
+        )
+
+        result = MongoDBBuilder(Mock()).create_connection(
+            config, ["users", "mydb.orders"], dry_run=True)
+
+        mock_mongo_client.assert_not_called()
+        assert [t.qualified_name for t in result["selected_tables"]] == [
+            "mydb.users", "mydb.orders"]
+
+    @patch('risingwave_connect.sources.mongodb.MongoClient')
+    def test_dry_run_without_database_uses_discovery(self, mock_mongo_client):
+        """Test that unqualified names are resolved by discovery, not a made-up database."""
+        mock_client = MagicMock()
+        mock_client.list_database_names.return_value = ["shop", "crm"]
+        database = mock_client.__getitem__.return_value
+        database.list_collection_names.return_value = ["users"]
+        database.command.return_value = {"count": 10, "size": 1024}
+        mock_mongo_client.return_value = mock_client
+        config = MongoDBConfig(
+            mongodb_url="mongodb://localhost:27017/?replicaSet=rs0",
+            collection_name="shop.*, crm.*"
+        )
+
+        result = MongoDBBuilder(Mock()).create_connection(
+            config, ["users"], dry_run=True)
+
+        mock_mongo_client.assert_called()
+        assert [t.qualified_name for t in result["selected_tables"]] == ["shop.users"]
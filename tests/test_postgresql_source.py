@@ -0,0 +1,198 @@
+"""Tests for PostgreSQL CDC source implementation."""
+
+import pytest
+import psycopg
+from unittest.mock import MagicMock, Mock, patch
+from risingwave_connect.client import RisingWaveClient
+from risingwave_connect.sources.postgresql import (
+    PostgreSQLConfig,
+    PostgreSQLDiscovery,
+    PostgreSQLSourceConnection
+)
+from risingwave_connect.builders.postgresql import PostgreSQLBuilder
+from risingwave_connect.connect_builder import ConnectBuilder, create_postgresql_cdc_source_connection
+from risingwave_connect.discovery.base import TableInfo
+
+
+def make_config():
+    return PostgreSQLConfig(
+        hostname="localhost",
+        port=5432,
+        username="postgres",
+        password="secret",
+        database="mydb"
+    )
+
+
+class TestPostgreSQLConfig:
+    """Test PostgreSQL configuration validation."""
+
+    def test_slot_name_validation(self):
+        """Test that slot names must be valid PostgreSQL replication slot names."""
+        config = make_config()
+        assert PostgreSQLConfig(**{**config.model_dump(), "slot_name": "rw_slot_1"}).slot_name == "rw_slot_1"
+
+        for bad_name in ["RW_Slot", "slot-name", "slot'; DROP TABLE x; --", "", "s" * 64]:
+            with pytest.raises(ValueError):
+                PostgreSQLConfig(**{**config.model_dump(), "slot_name": bad_name})
+
+    def test_publication_name_validation(self):
+        """Test that publication names follow the same rule as slot names."""
+        config = make_config()
+        assert PostgreSQLConfig(
+            **{**config.model_dump(), "publication_name": "rw_pub"}).publication_name == "rw_pub"
+
+        for bad_name in ["RW_Pub", "pub'; DROP TABLE x; --", ""]:
+            with pytest.raises(ValueError, match="publication_name"):
+                PostgreSQLConfig(**{**config.model_dump(), "publication_name": bad_name})
+
+
+class TestPostgreSQLDiscovery:
+    """Test PostgreSQL discovery functionality."""
+
+    @patch('risingwave_connect.sources.postgresql.psycopg.connect')
+    def test_connection_reused_across_calls(self, mock_connect):
+        """Test that discovery calls share one connection until closed."""
+        mock_conn = MagicMock()
+        mock_conn.closed = False
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchall.return_value = [("public",)]
+        mock_cursor.__iter__.return_value = [
+            ("public", "users", "BASE TABLE", None, None, None)]
+        mock_connect.return_value = mock_conn
+
+        with PostgreSQLDiscovery(make_config()) as discovery:
+            assert discovery.list_schemas() == ["public"]
+            tables = discovery.list_tables("public")
+
+        assert [t.qualified_name for t in tables] == ["public.users"]
+        mock_connect.assert_called_once()
+        assert mock_connect.call_args.kwargs["autocommit"] is True
+        mock_conn.close.assert_called_once()
+
+    @patch('risingwave_connect.sources.postgresql.psycopg.connect')
+    def test_reconnects_after_connection_closed(self, mock_connect):
+        """Test that a closed cached connection is replaced."""
+        first, second = MagicMock(closed=False), MagicMock(closed=False)
+        mock_connect.side_effect = [first, second]
+
+        discovery = PostgreSQLDiscovery(make_config())
+        discovery.list_schemas()
+        first.closed = True
+        discovery.list_schemas()
+
+        assert mock_connect.call_count == 2
+
+
+class TestPostgreSQLSourceConnection:
+    """Test PostgreSQL CDC SQL generation."""
+
+    def test_table_sql_with_backfill_overrides(self):
+        """Test that per-table overrides win over config-level backfill settings."""
+        config = make_config()
+        config.backfill_parallelism = "4"
+        source = PostgreSQLSourceConnection(MagicMock(), config)
+        table = TableInfo(schema_name="public", table_name="users")
+
+        default_sql = source.create_table_sql(table)
+        override_sql = source.create_table_sql(
+            table, backfill_parallelism="8", snapshot=False)
+
+        assert "backfill.parallelism='4'" in default_sql
+        assert "snapshot" not in default_sql
+        assert "backfill.parallelism='8'" in override_sql
+        assert "snapshot='false'" in override_sql
+        assert source.create_table_sql(table) == default_sql
+
+
+class TestPostgreSQLBuilder:
+    """Test PostgreSQL builder table selection."""
+
+    @patch('risingwave_connect.sources.postgresql.psycopg.connect')
+    def test_preselected_tables_used_as_is(self, mock_connect):
+        """Test that TableInfo lists bypass discovery and selection."""
+        tables = [TableInfo(schema_name="public", table_name="users"),
+                  TableInfo(schema_name="public", table_name="orders")]
+
+        result = PostgreSQLBuilder(MagicMock()).create_connection(
+            make_config(), tables, dry_run=True)
+
+        mock_connect.assert_not_called()
+        assert result["selected_tables"] == tables
+        assert len(result["sql_statements"]) == 3
+
+    @patch('risingwave_connect.builders.postgresql.PostgreSQLDiscovery')
+    def test_executes_statements_through_client(self, mock_discovery_cls):
+        """Test that the source and each table are created with RisingWaveClient.execute."""
+        tables = [TableInfo(schema_name="public", table_name="users"),
+                  TableInfo(schema_name="public", table_name="orders")]
+        rw_client = Mock(spec=RisingWaveClient)
+
+        result = PostgreSQLBuilder(rw_client).create_connection(make_config(), tables)
+
+        assert rw_client.execute.call_count == 3
+        assert [r["success"] for r in result["execution_results"]] == [True, True, True]
+
+    @patch.object(ConnectBuilder, 'create_postgresql_connection')
+    def test_include_all_tables_is_deprecated(self, mock_create):
+        """Test that the no-op include_all_tables flag warns and still selects everything."""
+        with pytest.warns(DeprecationWarning, match="include_all_tables"):
+            create_postgresql_cdc_source_connection(
+                MagicMock(), make_config(), include_all_tables=True, dry_run=True)
+
+        selector = mock_create.call_args.args[1]
+        assert selector.include_all is True
+
+    @patch('risingwave_connect.builders.postgresql.PostgreSQLDiscovery')
+    def test_discover_tables_cached_within_ttl(self, mock_discovery_cls):
+        """Test that repeated discovery reuses results until the TTL expires."""
+        discovery = mock_discovery_cls.return_value.__enter__.return_value
+        discovery.list_tables.return_value = [
+            TableInfo(schema_name="public", table_name="users")]
+        builder = PostgreSQLBuilder(MagicMock())
+
+        first = builder.discover_tables(make_config())
+        second = builder.discover_tables(make_config())
+
+        assert first == second
+        discovery.list_tables.assert_called_once_with("public")
+
+        # Callers get their own list, so changing one leaves the cache intact
+        first.clear()
+        assert builder.discover_tables(make_config()) == second
+        discovery.test_connection.assert_not_called()
+
+        builder.discovery_cache_ttl = 0
+        builder.discover_tables(make_config())
+        assert discovery.list_tables.call_count == 2
+
+    @patch('risingwave_connect.builders.postgresql.PostgreSQLDiscovery')
+    def test_discovery_cache_keyed_by_login(self, mock_discovery_cls):
+        """Test that configs for different users do not share cached results."""
+        discovery = mock_discovery_cls.return_value.__enter__.return_value
+        discovery.list_schemas.return_value = ["public"]
+        builder = PostgreSQLBuilder(MagicMock())
+        other_user = make_config()
+        other_user.username = "reporting"
+
+        builder.get_schemas(make_config())
+        builder.get_schemas(other_user)
+
+        assert make_config().connection_key() != other_user.connection_key()
+        assert discovery.list_schemas.call_count == 2
+
+        # Same login with another password must authenticate on its own
+        wrong_password = make_config()
+        wrong_password.password = "wrong"
+        builder.get_schemas(wrong_password)
+        assert discovery.list_schemas.call_count == 3
+        assert "wrong" not in wrong_password.connection_key()
+
+    @patch('risingwave_connect.builders.postgresql.PostgreSQLDiscovery')
+    def test_discovery_failure_raises_connection_error(self, mock_discovery_cls):
+        """Test that an unreachable database surfaces as ConnectionError."""
+        discovery = mock_discovery_cls.return_value.__enter__.return_value
+        discovery.list_schemas.side_effect = psycopg.OperationalError("refused")
+
+        with pytest.raises(ConnectionError, match="Cannot connect to PostgreSQL"):
+            PostgreSQLBuilder(MagicMock()).get_schemas(make_config())
@@ -1,9 +1,13 @@
 """Tests for SQL Server CDC source implementation."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from risingwave_connect.sources.sqlserver import SQLServerConfig, SQLServerDiscovery, SQLServerSourceConnection
 from risingwave_connect.discovery.base import TableInfo
+from risingwave_connect.builders.sqlserver import SQLServerBuilder
+from risingwave_connect.client import RisingWaveClient
 
 
 class TestSQLServerConfig:
@@ -113,6 +117,40 @@ class TestSQLServerConfig:
         patterns = config.get_table_patterns()
         assert patterns == ["dbo.*", "sales.orders", "hr.employees"]
 
+    def test_parsed_patterns(self):
+        """Test that table patterns are parsed once into triples."""
+        config = SQLServerConfig(
+            hostname="localhost",
+            port=1433,
+            username="sa",
+            password="password123",
+            database="testdb",
+            schema_name="sales",
+            table_name="dbo.*, orders, hr.employees"
+        )
+        assert config.parsed_patterns == (
+            ("dbo", "*", True),
+            ("sales", "orders", False),
+            ("hr", "employees", False),
+        )
+
+    def test_table_patterns_follow_table_name_changes(self):
+        """Test that patterns are re-derived after table_name changes."""
+        config = SQLServerConfig(
+            hostname="localhost",
+            port=1433,
+            username="sa",
+            password="password123",
+            database="testdb",
+            table_name="dbo.users"
+        )
+        copied = config.model_copy(update={"table_name": "sales.orders, hr.*"})
+        assert copied.get_table_patterns() == ["sales.orders", "hr.*"]
+        assert sorted(copied.get_schema_names()) == ["hr", "sales"]
+
+        config.table_name = "dbo.*"
+        assert config.parsed_patterns == (("dbo", "*", True),)
+
     def test_get_connection_string(self):
         """Test connection string generation."""
         config = SQLServerConfig(
@@ -130,6 +168,7 @@ class TestSQLServerConfig:
         assert "UID=sa" in conn_str
         assert "PWD=password123" in conn_str
         assert "Encrypt=yes" in conn_str
+        assert "PacketSize=32767" in conn_str
 
     def test_get_connection_string_no_encrypt(self):
         """Test connection string generation without encryption."""
@@ -145,6 +184,24 @@ class TestSQLServerConfig:
         conn_str = config.get_connection_string()
         assert "Encrypt=no" in conn_str
 
+    def test_connection_string_follows_config_changes(self):
+        """Test that the connection string reflects updated settings."""
+        config = SQLServerConfig(
+            hostname="localhost",
+            port=1433,
+            username="sa",
+            password="password123",
+            database="testdb",
+            table_name="dbo.users"
+        )
+        assert "DATABASE=testdb" in config.get_connection_string()
+
+        copied = config.model_copy(update={"database": "otherdb"})
+        assert "DATABASE=otherdb" in copied.get_connection_string()
+
+        config.hostname = "db.internal"
+        assert "SERVER=db.internal,1433" in config.connection_string
+
 
 class TestSQLServerDiscovery:
     """Test SQL Server discovery functionality."""
@@ -203,6 +260,67 @@ class TestSQLServerDiscovery:
         assert result["success"] is False
         assert "Connection failed" in result["message"]
 
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_connection_reused_across_calls(self, mock_pyodbc):
+        """Test that discovery calls share one connection until closed."""
+        mock_conn = MagicMock()
+        mock_pyodbc.connect.return_value = mock_conn
+
+        discovery = SQLServerDiscovery(self.config)
+        discovery.list_schemas()
+        discovery.list_tables("dbo")
+        discovery.get_table_columns("dbo", "users")
+
+        assert mock_pyodbc.connect.call_count == 1
+        assert mock_conn.cursor.call_count == 1
+        mock_conn.close.assert_not_called()
+
+        discovery.close()
+        mock_conn.close.assert_called_once()
+
+        discovery.list_schemas()
+        assert mock_pyodbc.connect.call_count == 2
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_reconnect_after_dead_connection(self, mock_pyodbc):
+        """Test that a failed call on a dead connection triggers a reconnect."""
+        dead_conn = MagicMock()
+        dead_conn.cursor.side_effect = Exception("Communication link failure")
+        live_conn = MagicMock()
+        mock_pyodbc.connect.side_effect = [dead_conn, live_conn]
+
+        with SQLServerDiscovery(self.config) as discovery:
+            assert discovery.list_schemas() == []
+            dead_conn.close.assert_called_once()
+
+            discovery.list_schemas()
+            assert mock_pyodbc.connect.call_count == 2
+
+        live_conn.close.assert_called_once()
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_retry_after_connection_drop(self, mock_pyodbc):
+        """Test that a query on a dropped connection reconnects and retries once."""
+        old_cursor = MagicMock()
+        old_conn = MagicMock()
+        old_conn.cursor.return_value = old_cursor
+        new_cursor = MagicMock()
+        new_cursor.__iter__.return_value = [("dbo",)]
+        new_conn = MagicMock()
+        new_conn.cursor.return_value = new_cursor
+        mock_pyodbc.connect.side_effect = [old_conn, new_conn]
+
+        with SQLServerDiscovery(self.config) as discovery:
+            discovery.list_schemas()
+
+            # Server went away between calls
+            old_cursor.execute.side_effect = Exception("Communication link failure")
+            old_conn.cursor.side_effect = Exception("Communication link failure")
+
+            assert discovery.list_schemas() == ["dbo"]
+            old_conn.close.assert_called_once()
+            assert mock_pyodbc.connect.call_count == 2
+
     @patch('risingwave_connect.sources.sqlserver.pyodbc')
     def test_list_schemas(self, mock_pyodbc):
         """Test listing schemas."""
@@ -212,11 +330,7 @@ class TestSQLServerDiscovery:
         mock_pyodbc.connect.return_value = mock_conn
 
         # Mock schema results
-        mock_cursor.fetchall.return_value = [
-            MagicMock(SCHEMA_NAME="dbo"),
-            MagicMock(SCHEMA_NAME="sales"),
-            MagicMock(SCHEMA_NAME="hr")
-        ]
+        mock_cursor.__iter__.return_value = [("dbo",), ("sales",), ("hr",)]
 
         discovery = SQLServerDiscovery(self.config)
         schemas = discovery.list_schemas()
@@ -232,11 +346,9 @@ class TestSQLServerDiscovery:
         mock_pyodbc.connect.return_value = mock_conn
 
         # Mock table results
-        mock_cursor.fetchall.return_value = [
-            MagicMock(TABLE_SCHEMA="dbo", TABLE_NAME="users",
-                      TABLE_TYPE="BASE TABLE"),
-            MagicMock(TABLE_SCHEMA="dbo", TABLE_NAME="orders",
-                      TABLE_TYPE="BASE TABLE")
+        mock_cursor.__iter__.return_value = [
+            ("dbo", "users", "BASE TABLE"),
+            ("dbo", "orders", "BASE TABLE")
         ]
 
         discovery = SQLServerDiscovery(self.config)
@@ -258,11 +370,10 @@ class TestSQLServerDiscovery:
         mock_pyodbc.connect.return_value = mock_conn
 
         # Mock table results
-        mock_cursor.fetchall.return_value = [
-            MagicMock(TABLE_SCHEMA="dbo", TABLE_NAME="users", row_count=1000),
-            MagicMock(TABLE_SCHEMA="dbo", TABLE_NAME="orders", row_count=5000),
-            MagicMock(TABLE_SCHEMA="sales",
-                      TABLE_NAME="customers", row_count=2000)
+        mock_cursor.__iter__.return_value = [
+            ("dbo", "users", "BASE TABLE"),
+            ("dbo", "orders", "BASE TABLE"),
+            ("sales", "customers", "BASE TABLE")
         ]
 
         discovery = SQLServerDiscovery(self.config)
@@ -277,6 +388,41 @@ class TestSQLServerDiscovery:
         assert len(tables) == 2
         assert all(table.schema_name == "dbo" for table in tables)
 
+        # Test overlapping patterns and bare table names
+        tables = discovery.check_specific_tables(["dbo.*", "dbo.users", "orders"])
+        assert [t.qualified_name for t in tables] == ["dbo.users", "dbo.orders"]
+
+        # Test missing table
+        assert discovery.check_specific_tables(["sales.missing"]) == []
+
+        # Only the schemas named by the patterns are queried
+        discovery.check_specific_tables(["sales.*", "hr.employees", "users"])
+        query, params = mock_cursor.execute.call_args[0]
+        assert "IN (?, ?, ?)" in query
+        assert "sys.partitions" not in query
+        assert params == ["sales", "hr", "dbo"]
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_check_specific_tables_stops_early(self, mock_pyodbc):
+        """Test that exact-name lookups stop reading once all are found."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_pyodbc.connect.return_value = mock_conn
+
+        rows = iter([
+            ("dbo", "users", "BASE TABLE"),
+            ("dbo", "orders", "BASE TABLE"),
+            ("dbo", "audit_log", "BASE TABLE"),
+        ])
+        mock_cursor.__iter__.return_value = rows
+
+        discovery = SQLServerDiscovery(self.config)
+        tables = discovery.check_specific_tables(["dbo.orders", "users"])
+
+        assert [t.table_name for t in tables] == ["orders", "users"]
+        assert next(rows) == ("dbo", "audit_log", "BASE TABLE")
+
     @patch('risingwave_connect.sources.sqlserver.pyodbc')
     def test_get_table_columns(self, mock_pyodbc):
         """Test getting table columns."""
@@ -286,13 +432,10 @@ class TestSQLServerDiscovery:
         mock_pyodbc.connect.return_value = mock_conn
 
         # Mock column results
-        mock_cursor.fetchall.return_value = [
-            MagicMock(COLUMN_NAME="id", DATA_TYPE="int",
-                      IS_NULLABLE="NO", ORDINAL_POSITION=1, IS_PRIMARY_KEY=1),
-            MagicMock(COLUMN_NAME="name", DATA_TYPE="varchar",
-                      IS_NULLABLE="YES", ORDINAL_POSITION=2, IS_PRIMARY_KEY=0),
-            MagicMock(COLUMN_NAME="email", DATA_TYPE="varchar",
-                      IS_NULLABLE="YES", ORDINAL_POSITION=3, IS_PRIMARY_KEY=0)
+        mock_cursor.__iter__.return_value = [
+            ("dbo", "users", "id", "int", "NO", 1, 1),
+            ("dbo", "users", "name", "varchar", "YES", 2, 0),
+            ("dbo", "users", "email", "varchar", "YES", 3, 0)
         ]
 
         discovery = SQLServerDiscovery(self.config)
@@ -309,6 +452,70 @@ class TestSQLServerDiscovery:
         assert columns[1].is_primary_key is False
         assert columns[1].is_nullable is True
 
+        # Only the requested table is queried
+        assert mock_cursor.execute.call_args.args[1] == ["dbo", "users"]
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_get_columns_for_tables(self, mock_pyodbc):
+        """Test fetching columns for several tables in one query."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_pyodbc.connect.return_value = mock_conn
+
+        mock_cursor.__iter__.return_value = [
+            ("dbo", "orders", "order_id", "bigint", "NO", 1, 1),
+            ("dbo", "users", "id", "int", "NO", 1, 1),
+            ("dbo", "users", "name", "nvarchar", "YES", 2, 0),
+        ]
+
+        discovery = SQLServerDiscovery(self.config)
+        columns = discovery.get_columns_for_tables(
+            [("dbo", "users"), ("dbo", "orders"), ("dbo", "users")])
+
+        assert mock_cursor.execute.call_count == 1
+        params = mock_cursor.execute.call_args[0][1]
+        assert params == ["dbo", "users", "dbo", "orders"]
+
+        assert set(columns) == {("dbo", "users"), ("dbo", "orders")}
+        assert [c.column_name for c in columns[("dbo", "users")]] == ["id", "name"]
+        assert columns[("dbo", "users")][1].data_type == "VARCHAR"
+        assert columns[("dbo", "orders")][0].is_primary_key is True
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_get_columns_for_tables_raises_on_failure(self, mock_pyodbc):
+        """Test that a failed column query is raised instead of returning partial results."""
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.execute.side_effect = Exception("timeout")
+        mock_pyodbc.connect.return_value = mock_conn
+
+        discovery = SQLServerDiscovery(self.config)
+        with pytest.raises(ConnectionError):
+            discovery.get_columns_for_tables([("dbo", "users")])
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_get_columns_for_tables_empty(self, mock_pyodbc):
+        """Test that no query is issued when no tables are requested."""
+        discovery = SQLServerDiscovery(self.config)
+        assert discovery.get_columns_for_tables([]) == {}
+        mock_pyodbc.connect.assert_not_called()
+
+    @patch('risingwave_connect.sources.sqlserver.pyodbc')
+    def test_alist_tables_queries_schemas_concurrently(self, mock_pyodbc):
+        """Test that each schema is listed over its own connection."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_pyodbc.connect.return_value = mock_conn
+        mock_cursor.__iter__.return_value = [("dbo", "users", "BASE TABLE")]
+
+        discovery = SQLServerDiscovery(self.config)
+        tables = asyncio.run(discovery.alist_tables(["dbo", "sales", "dbo"]))
+
+        assert len(tables) == 2
+        assert mock_pyodbc.connect.call_count == 2
+        assert mock_conn.close.call_count == 2
+
     def test_map_sqlserver_type_to_risingwave(self):
         """Test SQL Server to RisingWave type mapping."""
         discovery = SQLServerDiscovery(self.config)
@@ -392,6 +599,13 @@ class TestSQLServerSourceConnection:
         assert "password='password123'" in sql
         assert "database.name='testdb'" in sql
 
+    def test_create_source_sql_after_config_change(self):
+        """Test that source SQL reflects config changes made after construction."""
+        connection = SQLServerSourceConnection(self.mock_client, self.config)
+        self.config.password = "new'secret"
+
+        assert "password='new''secret'" in connection.create_source_sql()
+
     def test_create_source_sql_with_encryption(self):
         """Test SQL source creation with encryption."""
         config = SQLServerConfig(
@@ -437,6 +651,39 @@ class TestSQLServerSourceConnection:
             assert "FROM test_source TABLE 'dbo.users'" in sql
             assert "1,000 rows" in sql
 
+    def test_create_table_sql_with_prefetched_columns(self):
+        """Test table SQL creation from pre-fetched columns."""
+        table_info = TableInfo(schema_name="dbo", table_name="users")
+
+        with patch('risingwave_connect.sources.sqlserver.SQLServerDiscovery') as mock_discovery_class:
+            connection = SQLServerSourceConnection(
+                self.mock_client, self.config)
+            sql = connection.create_table_sql(
+                table_info,
+                table_columns=[
+                    Mock(column_name="id", data_type="INTEGER",
+                         is_nullable=False, is_primary_key=True, ordinal_position=1)
+                ]
+            )
+
+            mock_discovery_class.assert_not_called()
+            assert "id INTEGER PRIMARY KEY" in sql
+
+    def test_create_table_sql_reuses_discovery(self):
+        """Test that one discovery instance serves every table."""
+        with patch('risingwave_connect.sources.sqlserver.SQLServerDiscovery') as mock_discovery_class:
+            mock_discovery_class.return_value.get_table_columns.return_value = [
+                Mock(column_name="id", data_type="INTEGER",
+                     is_nullable=False, is_primary_key=True, ordinal_position=1)
+            ]
+
+            connection = SQLServerSourceConnection(
+                self.mock_client, self.config)
+            connection.create_table_sql(TableInfo(schema_name="dbo", table_name="users"))
+            connection.create_table_sql(TableInfo(schema_name="dbo", table_name="orders"))
+
+            mock_discovery_class.assert_called_once_with(self.config)
+
     def test_create_table_sql_with_metadata(self):
         """Test table SQL creation with metadata columns."""
         table_info = TableInfo(
@@ -504,6 +751,27 @@ class TestSQLServerSourceConnection:
             assert "snapshot.interval='2'" in sql
             assert "snapshot.batch_size='500'" in sql
 
+    def test_generate_columns_sql_primary_keys(self):
+        """Test inline and composite primary key generation."""
+        connection = SQLServerSourceConnection(self.mock_client, self.config)
+
+        single = connection._generate_columns_sql([
+            Mock(column_name="name", data_type="VARCHAR",
+                 is_nullable=True, is_primary_key=False),
+            Mock(column_name="id", data_type="INTEGER",
+                 is_nullable=False, is_primary_key=True),
+        ])
+        assert single == "name VARCHAR,\n    id INTEGER PRIMARY KEY"
+
+        composite = connection._generate_columns_sql([
+            Mock(column_name="order_id", data_type="BIGINT",
+                 is_nullable=False, is_primary_key=True),
+            Mock(column_name="line_no", data_type="INTEGER",
+                 is_nullable=False, is_primary_key=True),
+        ])
+        assert composite.endswith("PRIMARY KEY (order_id, line_no)")
+        assert "order_id BIGINT NOT NULL" in composite
+
     def test_escape_sql_string(self):
         """Test SQL string escaping."""
         connection = SQLServerSourceConnection(self.mock_client, self.config)
@@ -519,3 +787,47 @@ class TestSQLServerSourceConnection:
         # Test no quotes
         escaped = connection._escape_sql_string("normal string")
         assert escaped == "normal string"
+
+
+class TestSQLServerBuilder:
+    """Test SQL Server builder table SQL generation."""
+
+    def setup_method(self):
+        """Set up test configuration."""
+        self.config = SQLServerConfig(
+            hostname="localhost",
+            port=1433,
+            username="sa",
+            password="password123",
+            database="testdb",
+            table_name="dbo.users"
+        )
+
+    def test_batch_column_fetch_failure_falls_back_per_table(self):
+        """Test that a failed batch column fetch still generates table columns."""
+        with patch('risingwave_connect.builders.sqlserver.SQLServerDiscovery') as mock_discovery_class:
+            discovery = mock_discovery_class.return_value.__enter__.return_value
+            discovery.test_connection.return_value = {"success": True}
+            discovery.check_specific_tables.return_value = [
+                TableInfo(schema_name="dbo", table_name="users")]
+            discovery.get_columns_for_tables.side_effect = Exception("timeout")
+            discovery.get_table_columns.return_value = [
+                Mock(column_name="id", data_type="INTEGER",
+                     is_nullable=False, is_primary_key=True, ordinal_position=1)
+            ]
+
+            rw_client = Mock(spec=RisingWaveClient)
+            result = SQLServerBuilder(rw_client).create_connection(self.config)
+
+        assert "id INTEGER PRIMARY KEY" in result["sql_statements"][1]
+        assert rw_client.execute.call_count == 2
+
+    def test_dry_run_skips_batch_column_fetch(self):
+        """Test that dry run does not batch-fetch columns."""
+        with patch('risingwave_connect.builders.sqlserver.SQLServerDiscovery') as mock_discovery_class:
+            discovery = mock_discovery_class.return_value.__enter__.return_value
+            discovery.get_table_columns.return_value = []
+
+            SQLServerBuilder(Mock()).create_connection(self.config, dry_run=True)
+
+        discovery.get_columns_for_tables.assert_not_called()
@@ -0,0 +1,80 @@
+"""Tests for TableSelector table selection."""
+
+import dataclasses
+
+import pytest
+
+from risingwave_connect.discovery.base import TableSelector, TableInfo
+
+
+def make_tables():
+    return [
+        TableInfo(schema_name="public", table_name="users"),
+        TableInfo(schema_name="public", table_name="orders"),
+        TableInfo(schema_name="public", table_name="orders_backup"),
+        TableInfo(schema_name="sales", table_name="Customers"),
+    ]
+
+
+class TestTableSelector:
+    """Test pattern and specific-table selection."""
+
+    def test_include_all(self):
+        """Test selecting every table."""
+        selector = TableSelector(include_all=True)
+        assert len(selector.select_tables(make_tables())) == 4
+
+    def test_include_patterns(self):
+        """Test glob patterns against bare and qualified names."""
+        selector = TableSelector(include_patterns=["orders*", "sales.*"])
+        selected = selector.select_tables(make_tables())
+        assert [t.qualified_name for t in selected] == [
+            "public.orders", "public.orders_backup", "sales.Customers"]
+
+    def test_patterns_are_case_insensitive(self):
+        """Test that matching ignores case on both sides."""
+        selector = TableSelector(include_patterns=["CUSTOMERS"])
+        selected = selector.select_tables(make_tables())
+        assert [t.table_name for t in selected] == ["Customers"]
+
+    def test_exclude_patterns(self):
+        """Test excluding tables after inclusion."""
+        selector = TableSelector(include_all=True, exclude_patterns=["*_backup", "sales.*"])
+        selected = selector.select_tables(make_tables())
+        assert [t.table_name for t in selected] == ["users", "orders"]
+
+    def test_specific_tables(self):
+        """Test specific tables, including ones not yet discovered."""
+        selector = TableSelector(specific_tables=["sales.Customers", "users", "inventory.items"])
+        selected = selector.select_tables(make_tables())
+
+        assert [t.qualified_name for t in selected] == [
+            "sales.Customers", "public.users", "inventory.items"]
+        assert selected[2].comment is not None
+
+    def test_select_stream_consumes_iterator(self):
+        """Test streaming selection over a generator of tables."""
+        selector = TableSelector(include_patterns=["orders*"], exclude_patterns=["*_backup"])
+        stream = selector.select_stream(iter(make_tables()))
+
+        assert next(stream).qualified_name == "public.orders"
+        assert list(stream) == []
+
+    def test_renamed_table_matches_new_name(self):
+        """Test that derived names follow a copy with a new table name."""
+        table = TableInfo(schema_name="public", table_name="users")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            table.table_name = "orders"
+
+        renamed = dataclasses.replace(table, table_name="orders")
+        assert renamed.qualified_name == "public.orders"
+        selector = TableSelector(include_patterns=["orders"])
+        assert selector.select_tables([renamed]) == [renamed]
+
+    def test_pattern_changes_after_construction_apply(self):
+        """Test that edits to the public pattern lists affect later selections."""
+        selector = TableSelector(include_patterns=["users"])
+        selector.include_patterns.append("orders")
+        selector.exclude_patterns = ["users"]
+
+        assert [t.table_name for t in selector.select_tables(make_tables())] == ["orders"]